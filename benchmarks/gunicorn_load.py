@@ -0,0 +1,112 @@
+"""Load test: requests/s and latency for each gunicorn worker class.
+
+Starts ``gunicorn main:app`` (with gunicorn.conf.py) once per worker
+class on a local port, drives it with keep-alive client threads hitting a
+mix of public pages and feeds, and prints throughput and p50/p99 latency.
+Uses whatever database main.py picks (local.db outside Fly), so seed it
+first for meaningful numbers, e.g. with ``flask import-events``.
+
+    python benchmarks/gunicorn_load.py [--seconds 10] [--clients 32] [--modes sync gthread gevent]
+"""
+import argparse
+import http.client
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = [
+    "/",
+    "/all",
+    "/calendar",
+    "/data/groups.json",
+    "/data/events.json",
+    "/search_zip?zip=02116",
+    "/api/groups/near?lat=42.36&lon=-71.06&radius_km=50",
+]
+
+
+def wait_until_up(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/healthz")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"gunicorn did not come up on port {port}")
+
+
+def drive(port, seconds, clients):
+    stop = time.monotonic() + seconds
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+
+    def client():
+        mine, failed = [], 0
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        while time.monotonic() < stop:
+            started = time.perf_counter()
+            try:
+                conn.request("GET", random.choice(PATHS))
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            mine.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(mine)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sorted(latencies), errors[0]
+
+
+def percentile(ordered, pct):
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--modes", nargs="+", default=["sync", "gthread", "gevent"])
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        env = dict(os.environ, GUNICORN_WORKER_CLASS=mode, GUNICORN_BIND=f"127.0.0.1:{args.port}")
+        server = subprocess.Popen([sys.executable, "-m", "gunicorn", "main:app"], cwd=ROOT, env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_up(args.port)
+            drive(args.port, 1, 4)  # warm caches and snapshots
+            latencies, errors = drive(args.port, args.seconds, args.clients)
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(f"{mode:>8}: {len(latencies) / args.seconds:8.1f} req/s  "
+              f"p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+              f"p99 {percentile(latencies, 99) * 1000:7.1f} ms  errors {errors}")
+
+
+if __name__ == "__main__":
+    main()
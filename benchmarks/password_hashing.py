@@ -0,0 +1,105 @@
+"""Benchmark: login throughput under concurrent load.
+
+Simulates ``--clients`` concurrent logins (each one password verify) while
+a background "page view" thread measures how long a trivial request has
+to wait for the CPU.  Compares hashing inline on every request thread
+with ``passwords.PasswordHasher`` (capped pool), for a couple of hash
+methods.
+
+    python benchmarks/password_hashing.py [--clients 16] [--logins 64]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.security import check_password_hash, generate_password_hash  # noqa: E402
+
+from passwords import PasswordHasher, PasswordHasherBusy  # noqa: E402
+
+METHODS = ("scrypt:32768:8:1", "pbkdf2:sha256:600000")
+
+
+def percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else float("nan")
+
+
+def page_view_latencies(stop):
+    """Latency of a small pure-Python request handler while logins run."""
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        sum(i * i for i in range(2000))
+        samples.append(time.perf_counter() - started)
+        time.sleep(0.005)
+    return samples
+
+
+def run(verify, stored, clients, logins):
+    latencies, rejected = [], [0]
+    lock = threading.Lock()
+    per_client = logins // clients
+
+    def client():
+        mine = []
+        for _ in range(per_client):
+            started = time.perf_counter()
+            try:
+                verify(stored, "correct horse")
+            except PasswordHasherBusy:
+                with lock:
+                    rejected[0] += 1
+                continue
+            mine.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(mine)
+
+    stop = threading.Event()
+    views = []
+    viewer = threading.Thread(target=lambda: views.extend(page_view_latencies(stop)))
+    viewer.start()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    viewer.join()
+
+    latencies.sort()
+    views.sort()
+    return len(latencies) / elapsed, percentile(latencies, 99), percentile(views, 99), rejected[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{args.clients} concurrent clients, {args.logins} logins, {os.cpu_count()} CPU(s)")
+    for method in METHODS:
+        stored = generate_password_hash("correct horse", method)
+        hasher = PasswordHasher(SimpleNamespace(config={
+            "PASSWORD_HASH_METHOD": method,
+            "PASSWORD_HASH_WORKERS": args.workers,
+            "PASSWORD_HASH_QUEUE": args.logins,
+        }))
+
+        for label, verify in (("inline", check_password_hash), (f"pool x{args.workers}", hasher.verify)):
+            rate, p99, view_p99, rejected = run(verify, stored, args.clients, args.logins)
+            print(f"{method:>22} {label:>8}: {rate:6.1f} logins/s  login p99 {p99 * 1000:7.1f} ms  "
+                  f"page view p99 {view_p99 * 1000:6.2f} ms  rejected {rejected}")
+        print(f"{'':>31} pool stats: {hasher.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Micro-benchmark: expanding monthly recurring events over a year.
+
+Compares the old per-event ``calendar.Calendar`` month-grid loop with
+``recurrence.MonthlyRule`` (one event at a time) and ``expand_many``
+(batched, shared per rule).
+
+    python benchmarks/recurrence_bench.py
+"""
+import calendar
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recurrence import MonthlyRule, WEEKDAYS, WEEK_ORDINALS, expand_many, nth_weekday  # noqa: E402
+
+START = datetime(2026, 1, 1)
+END = datetime(2027, 1, 1)
+
+
+def legacy_expand(week, day, months=12):
+    week_offsets = {"first": 0, "second": 1, "third": 2, "fourth": 3, "last": -1}
+    dates = []
+    for month_offset in range(months):
+        month = (START.month + month_offset - 1) % 12 + 1
+        year = START.year + (START.month + month_offset - 1) // 12
+        grid = calendar.Calendar().monthdatescalendar(year, month)
+        weekday_dates = [w[WEEKDAYS[day]] for w in grid if w[WEEKDAYS[day]].month == month]
+        dates.append(weekday_dates[week_offsets[week]])
+    return dates
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    random.seed(42)
+    for n in (100, 1_000, 10_000):
+        fields = [(random.choice(list(WEEK_ORDINALS)), random.choice(list(WEEKDAYS)), "7:00 PM")
+                  for _ in range(n)]
+        rules = {i: MonthlyRule.from_fields(*f) for i, f in enumerate(fields)}
+
+        legacy = timed(lambda: [legacy_expand(week, day) for week, day, _ in fields])
+        nth_weekday.cache_clear()
+        single = timed(lambda: [rule.occurrences(START, END) for rule in rules.values()])
+        nth_weekday.cache_clear()
+        batched = timed(lambda: expand_many(rules, START, END))
+
+        print(f"{n:>6} events x 12 months: legacy {legacy:8.1f} ms | "
+              f"MonthlyRule {single:7.1f} ms | expand_many {batched:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
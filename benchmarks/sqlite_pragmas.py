@@ -0,0 +1,124 @@
+"""Benchmark: mixed read/write load under two SQLite pragma profiles.
+
+Reader threads run the kind of query the public pages do (approved
+events in a date window) while writer threads insert and update rows,
+each committing per statement like a form post.  Runs once with SQLite's
+stock settings (rollback journal, synchronous=FULL) and once with
+``sqlite_tuning.DEFAULT_PRAGMAS``, on a scratch database file.
+
+    python benchmarks/sqlite_pragmas.py [--seconds 5] [--readers 4] [--writers 2]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_tuning import DEFAULT_PRAGMAS, apply_pragmas, describe, effective_pragmas  # noqa: E402
+
+# What the app ran with before: SQLite defaults plus Python's 5 s connect timeout
+STOCK = {"journal_mode": "DELETE", "synchronous": "FULL", "foreign_keys": "ON", "busy_timeout": 5000}
+ROWS = 20_000
+START = datetime(2026, 1, 1)
+
+
+def seed(path):
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE event (
+        id INTEGER PRIMARY KEY, title TEXT, date_time TEXT, status TEXT, group_id INTEGER)""")
+    conn.execute("CREATE INDEX ix_event_status_date ON event (status, date_time)")
+    conn.executemany(
+        "INSERT INTO event (title, date_time, status, group_id) VALUES (?, ?, ?, ?)",
+        [(f"Event {i}", (START + timedelta(hours=i)).isoformat(" "),
+          random.choice(("approved", "approved", "pending")), random.randint(1, 300))
+         for i in range(ROWS)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def run(path, pragmas, seconds, readers, writers):
+    stop = time.perf_counter() + seconds
+    counts = {"reads": 0, "writes": 0, "busy": 0}
+    lock = threading.Lock()
+
+    def connect():
+        # timeout=0 so the profile's busy_timeout is what decides waiting
+        conn = sqlite3.connect(path, timeout=0, check_same_thread=False)
+        apply_pragmas(conn, pragmas)
+        return conn
+
+    def reader():
+        conn, done = connect(), 0
+        while time.perf_counter() < stop:
+            day = START + timedelta(days=random.randint(0, ROWS // 24))
+            try:
+                conn.execute(
+                    "SELECT id, title, date_time FROM event WHERE status = 'approved' "
+                    "AND date_time >= ? AND date_time < ? ORDER BY date_time",
+                    (day.isoformat(" "), (day + timedelta(days=31)).isoformat(" ")),
+                ).fetchall()
+                done += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts["busy"] += 1
+        with lock:
+            counts["reads"] += done
+
+    def writer():
+        conn, done = connect(), 0
+        while time.perf_counter() < stop:
+            try:
+                if random.random() < 0.5:
+                    conn.execute("INSERT INTO event (title, date_time, status, group_id) VALUES (?, ?, 'pending', 1)",
+                                 ("New", START.isoformat(" ")))
+                else:
+                    conn.execute("UPDATE event SET status = 'approved' WHERE id = ?", (random.randint(1, ROWS),))
+                conn.commit()
+                done += 1
+            except sqlite3.OperationalError:
+                conn.rollback()
+                with lock:
+                    counts["busy"] += 1
+        with lock:
+            counts["writes"] += done
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {k: v / seconds for k, v in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    for label, pragmas in (("stock", STOCK), ("tuned", DEFAULT_PRAGMAS)):
+        random.seed(7)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.sqlite")
+            seed(path)
+            probe = sqlite3.connect(path, timeout=0)
+            apply_pragmas(probe, pragmas)
+            print(f"{label}: {describe(effective_pragmas(probe))}")
+            probe.close()
+
+            rates = run(path, pragmas, args.seconds, args.readers, args.writers)
+            print(f"  {rates['reads']:9,.0f} reads/s  {rates['writes']:7,.0f} writes/s  "
+                  f"{rates['busy']:7,.0f} 'database is locked'/s")
+
+
+if __name__ == "__main__":
+    main()
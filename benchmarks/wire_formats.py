@@ -0,0 +1,105 @@
+"""Benchmark: feed payload size and encode time, JSON objects vs. columnar.
+
+Builds synthetic rows shaped like ``/all`` (``Catholic.to_dict``),
+``/data/groups.json`` and ``/data/events.json`` and encodes them the way
+the feeds do: the current array of objects, ``wire.encode(..., "columnar")``
+and, when ``msgpack`` is installed, ``wire.encode(..., "msgpack")``.  Sizes
+are shown raw and gzipped, since the snapshot feeds are sent gzipped.
+
+    python benchmarks/wire_formats.py [--rows 5000]
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wire  # noqa: E402
+
+CITIES = [("Boston", "MA"), ("Worcester", "MA"), ("Providence", "RI"), ("Hartford", "CT"),
+          ("Burlington", "VT"), ("Portland", "ME"), ("Manchester", "NH"), ("New Haven", "CT")]
+WORDS = "young adult catholic group prayer rosary bible study adoration mass social service".split()
+
+
+def text(n):
+    return " ".join(random.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def group_rows(n):
+    rows = []
+    for i in range(1, n + 1):
+        city, state = random.choice(CITIES)
+        rows.append({
+            "id": i, "name": f"{text(3)} {i}", "city": city, "state": state,
+            "group_details": text(25), "website_address": f"https://example.org/groups/{i}",
+            "social_media": f"@group{i}", "lat": random.uniform(41, 47.4), "lon": random.uniform(-73.7, -67),
+            "img_url": None, "map_url": None, "status": "approved",
+            "zip_code": f"0{random.randint(1000, 6999)}", "subscribed": False,
+        })
+    return rows
+
+
+def map_rows(groups):
+    return [{"name": g["name"], "description": g["group_details"], "lat": g["lat"], "lon": g["lon"],
+             "city": g["city"], "state": g["state"], "website": g["website_address"],
+             "social": g["social_media"]} for g in groups]
+
+
+def event_rows(n):
+    start = datetime(2026, 1, 1, 19)
+    rows = []
+    for i in range(1, n + 1):
+        city, _ = random.choice(CITIES)
+        recurring = random.random() < 0.2
+        rows.append({
+            "id": i, "title": text(4), "description": text(30),
+            "date_time": None if recurring else (start + timedelta(hours=7 * i)).isoformat(),
+            "address": f"{random.randint(1, 999)} Main St, {city}", "zip_code": f"0{random.randint(1000, 6999)}",
+            "lat": random.uniform(41, 47.4), "lon": random.uniform(-73.7, -67), "status": "approved",
+            "city": city, "ics_url": f"/event/{i}/ical", "is_internal": True, "is_recurring": recurring,
+            "recurring_day": "Friday" if recurring else None, "recurring_week": "first" if recurring else None,
+            "recurring_time": "7:00 PM" if recurring else None, "link": None,
+        })
+    return rows
+
+
+def measure(label, encode, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = encode()
+        best = min(best, time.perf_counter() - started)
+    gz = gzip.compress(body, compresslevel=6, mtime=0)
+    print(f"  {label:<16} {len(body):>10,} B {len(gz):>10,} B gz {best * 1000:>8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    groups = group_rows(args.rows)
+    feeds = [
+        ("/all", lambda rows: {"groups": rows}, groups, wire.GROUP_FIELDS),
+        ("/data/groups.json", lambda rows: rows, map_rows(groups), wire.MAP_FIELDS),
+        ("/data/events.json", lambda rows: rows, event_rows(args.rows), wire.EVENT_FIELDS),
+    ]
+    formats = ["columnar"] + (["msgpack"] if wire.msgpack is not None else [])
+    if wire.msgpack is None:
+        print("(msgpack not installed: skipping MessagePack)")
+
+    for name, shape, rows, fields in feeds:
+        print(f"{name} ({len(rows)} rows)")
+        measure("json objects", lambda: json.dumps(shape(rows), separators=(",", ":")).encode())
+        for fmt in formats:
+            measure(fmt, lambda: wire.encode(rows, fields, fmt))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Serving the simplified state outlines built by build_boundaries.py.
+
+The files in ``static/data/boundaries`` have a content hash in their
+names, so responses are marked immutable and a changed outline gets a new
+URL.  The precompressed copies (``.br``, ``.gz``) are sent as they are
+when the client accepts that encoding; nothing is compressed per request.
+"""
+import json
+import os
+
+from flask import abort, request, send_from_directory
+
+
+BOUNDARY_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "static", "data", "boundaries")
+MIMETYPE = "application/geo+json"
+IMMUTABLE = "public, max-age=31536000, immutable"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_manifest = None
+
+
+def levels():
+    """``[{"max_zoom", "file", ...}, ...]`` from the manifest, coarsest first; [] if not built."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(BOUNDARY_DIR, "manifest.json")) as f:
+                _manifest = json.load(f)["levels"]
+        except FileNotFoundError:
+            _manifest = []
+    return _manifest
+
+
+def response(filename):
+    """The file named in the manifest, in the best encoding the client accepts."""
+    if filename not in {level["file"] for level in levels()}:
+        abort(404)
+
+    for encoding, suffix in ENCODINGS:
+        if request.accept_encodings[encoding] and os.path.exists(os.path.join(BOUNDARY_DIR, filename + suffix)):
+            response = send_from_directory(BOUNDARY_DIR, filename + suffix, mimetype=MIMETYPE)
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(BOUNDARY_DIR, filename, mimetype=MIMETYPE)
+
+    response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = IMMUTABLE
+    return response
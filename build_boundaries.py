@@ -0,0 +1,153 @@
+"""Build static/data/boundaries/ from static/data/new_england_states.geojson.
+
+The map only needs as much outline detail as one screen pixel can show.
+For each entry in ``LEVELS`` the rings are simplified with Douglas-Peucker
+in Web Mercator pixels at that zoom, rings smaller than a few pixels are
+dropped, and coordinates are rounded to the decimals a quarter pixel
+needs.  Each level is written with a content hash in its name (so it can
+be cached forever) next to a gzip copy, and a brotli copy when the
+``brotli`` package is installed.  ``manifest.json`` lists the files;
+boundaries.py serves them.
+
+Only needed when the source GeoJSON changes:
+
+    python build_boundaries.py
+"""
+import gzip
+import hashlib
+import json
+import math
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# (highest zoom the file is drawn at, zoom whose pixel size sets the tolerance)
+LEVELS = [(6, 6), (8, 8), (10, 10), (99, 12)]
+TOLERANCE_PX = 0.75
+MIN_RING_AREA_PX = 4.0
+KEEP_PROPERTIES = ("NAME", "STATE")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(ROOT, "static", "data", "new_england_states.geojson")
+OUT_DIR = os.path.join(ROOT, "static", "data", "boundaries")
+
+
+def to_pixels(lon, lat, zoom):
+    scale = 256 * 2 ** zoom
+    s = math.sin(math.radians(lat))
+    return (lon + 180) / 360 * scale, (0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)) * scale
+
+
+def segment_distance(p, a, b):
+    (px, py), (ax, ay), (bx, by) = p, a, b
+    dx, dy = bx - ax, by - ay
+    if dx == 0 and dy == 0:
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def douglas_peucker(points, tolerance):
+    """Indexes of ``points`` to keep (always the first and last)."""
+    keep = {0, len(points) - 1}
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, worst_distance = None, tolerance
+        for i in range(first + 1, last):
+            distance = segment_distance(points[i], points[first], points[last])
+            if distance > worst_distance:
+                worst, worst_distance = i, distance
+        if worst is not None:
+            keep.add(worst)
+            stack += [(first, worst), (worst, last)]
+    return sorted(keep)
+
+
+def ring_area(points):
+    return abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(points, points[1:]))) / 2
+
+
+def simplify_ring(ring, zoom, decimals):
+    """The ring simplified for ``zoom`` and rounded, or None if it's too small to draw."""
+    pixels = [to_pixels(lon, lat, zoom) for lon, lat in ring]
+    if ring_area(pixels) < MIN_RING_AREA_PX:
+        return None
+    kept = [ring[i] for i in douglas_peucker(pixels, TOLERANCE_PX)]
+    rounded = []
+    for lon, lat in kept:
+        point = [round(lon, decimals), round(lat, decimals)]
+        if not rounded or point != rounded[-1]:
+            rounded.append(point)
+    return rounded if len(rounded) >= 4 else None
+
+
+def simplify_polygon(polygon, zoom, decimals):
+    rings = [simplify_ring(ring, zoom, decimals) for ring in polygon]
+    if rings[0] is None:
+        return None
+    return [ring for ring in rings if ring is not None]
+
+
+def simplify_feature(feature, zoom, decimals):
+    geometry = feature["geometry"]
+    polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+    simplified = [p for p in (simplify_polygon(p, zoom, decimals) for p in polygons) if p]
+    if not simplified:
+        # Keep at least the largest polygon so every state is drawn
+        largest = max(polygons, key=lambda p: ring_area([to_pixels(*point, zoom) for point in p[0]]))
+        simplified = [[[[round(lon, decimals), round(lat, decimals)] for lon, lat in largest[0]]]]
+    return {
+        "type": "Feature",
+        "properties": {key: feature["properties"].get(key) for key in KEEP_PROPERTIES},
+        "geometry": {"type": "MultiPolygon", "coordinates": simplified},
+    }
+
+
+def decimals_for(zoom):
+    """Decimal places that keep rounding under a quarter pixel at ``zoom``."""
+    degrees_per_pixel = 360 / (256 * 2 ** zoom)
+    return max(0, math.ceil(-math.log10(degrees_per_pixel / 4)))
+
+
+def write_level(source, max_zoom, zoom):
+    decimals = decimals_for(zoom)
+    collection = {
+        "type": "FeatureCollection",
+        "features": [simplify_feature(f, zoom, decimals) for f in source["features"]],
+    }
+    body = json.dumps(collection, separators=(",", ":")).encode()
+    name = f"new_england_states.z{zoom}.{hashlib.sha256(body).hexdigest()[:12]}.geojson"
+
+    with open(os.path.join(OUT_DIR, name), "wb") as f:
+        f.write(body)
+    with open(os.path.join(OUT_DIR, name + ".gz"), "wb") as f:
+        f.write(gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(os.path.join(OUT_DIR, name + ".br"), "wb") as f:
+            f.write(brotli.compress(body, quality=11))
+
+    vertices = sum(len(ring) for feature in collection["features"]
+                   for polygon in feature["geometry"]["coordinates"] for ring in polygon)
+    return {"max_zoom": max_zoom, "file": name, "bytes": len(body), "vertices": vertices}
+
+
+if __name__ == "__main__":
+    with open(SOURCE) as f:
+        source = json.load(f)
+
+    os.makedirs(OUT_DIR, exist_ok=True)
+    for old in os.listdir(OUT_DIR):
+        os.remove(os.path.join(OUT_DIR, old))
+
+    levels = [write_level(source, max_zoom, zoom) for max_zoom, zoom in LEVELS]
+    with open(os.path.join(OUT_DIR, "manifest.json"), "w") as f:
+        json.dump({"levels": levels}, f, indent=2)
+
+    for level in levels:
+        gz_size = os.path.getsize(os.path.join(OUT_DIR, level["file"] + ".gz"))
+        print(f"✅ zoom <= {level['max_zoom']}: {level['vertices']} vertices, "
+              f"{level['bytes']} bytes ({gz_size} gzipped) -> {level['file']}")
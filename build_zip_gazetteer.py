@@ -0,0 +1,35 @@
+"""Build static/data/ne_zip_centroids.csv from the `zipcodes` package.
+
+Only needed when refreshing the bundled data; the app itself never imports
+`zipcodes`.
+
+    pip install zipcodes
+    python build_zip_gazetteer.py
+"""
+import bz2
+import csv
+import json
+import os
+
+import zipcodes
+
+NEW_ENGLAND_STATES = {"MA", "ME", "NH", "VT", "RI", "CT"}
+
+source = os.path.join(os.path.dirname(zipcodes.__file__), "zips.json.bz2")
+out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "data", "ne_zip_centroids.csv")
+
+with bz2.open(source, "rt") as f:
+    records = json.load(f)
+
+rows = sorted(
+    (r["zip_code"], round(float(r["lat"]), 4), round(float(r["long"]), 4))
+    for r in records
+    if r["state"] in NEW_ENGLAND_STATES and r["lat"] and r["long"]
+)
+
+with open(out_path, "w", newline="") as f:
+    writer = csv.writer(f)
+    writer.writerow(["zip", "lat", "lon"])
+    writer.writerows(rows)
+
+print(f"✅ Wrote {len(rows)} ZIP centroids to {out_path}")
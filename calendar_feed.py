@@ -0,0 +1,58 @@
+"""Month buckets behind the calendar's event source (``/api/events``).
+
+FullCalendar asks for ``?start=&end=`` every time the visible range
+changes.  The answer is assembled from one bucket per month touching the
+range, keyed by ``(year, month, status)``: the dated events of that month
+(one range query on ``ix_event_status_date_time``) plus the occurrences of
+recurring events that fall in it.  Each bucket remembers the data
+versions it was built from (see versioning.py), so a change in any
+process rebuilds only the buckets that are asked for again.
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from recurrence import add_months, iter_months
+
+
+MAX_MONTHS = 14   # widest window one request may ask for
+
+
+def month_windows(start, end):
+    """``(year, month, first, next_first)`` for every month touching [start, end)."""
+    for year, month in iter_months(start, end):
+        first = datetime(year, month, 1)
+        yield year, month, first, add_months(first, 1)
+
+
+class MonthBuckets:
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()   # (year, month, status) -> (version, [(start, item), ...])
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key, version, build):
+        """The bucket for ``key`` at ``version``, building it with ``build()`` if needed."""
+        entry = self._buckets.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        items = build()
+        with self._lock:
+            self._buckets[key] = (version, items)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return items
+
+    def window(self, start, end, status, version, build_month):
+        """Items starting in [start, end), in order; ``build_month(status, first, next_first)``."""
+        found = []
+        for year, month, first, next_first in month_windows(start, end):
+            bucket = self.get((year, month, status), version,
+                              lambda: build_month(status, first, next_first))
+            found.extend(item for when, item in bucket if start <= when < end)
+        return found
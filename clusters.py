@@ -0,0 +1,197 @@
+"""Marker clusters for the map, from a per-zoom grid over group locations.
+
+Each zoom level divides the Web Mercator world into square cells of
+``CELL_PX`` screen pixels (four per map tile), and each cell keeps a count,
+coordinate sums for its centroid and the ids in it.  The cells of one zoom
+are the cells of the next zoom with one bit of x and y dropped, so a point
+is placed in every level by shifting the same two integers.
+
+A viewport query only looks at the cells overlapping the bounding box, so
+its cost and payload follow what is on screen, not the size of the
+directory.
+
+Commits made in this process are applied point by point (see ``watch``).
+A ``catholic`` data version the index can't account for, i.e. a write from
+another process or a bulk UPDATE, means a full rebuild on the next query.
+"""
+import heapq
+import math
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from versioning import read_versions
+
+
+MAX_ZOOM = 16      # below this a cell is a few metres across; deeper zooms reuse it
+CELL_BITS = 2      # 2**2 cells per tile side, i.e. 64px cells on 256px tiles
+CELL_PX = 256 >> CELL_BITS
+MAX_LAT = 85.05112878
+SAMPLE_IDS = 3     # representative ids returned per cluster
+
+
+def grid_xy(lat, lon):
+    """Integer cell coordinates at ``MAX_ZOOM``."""
+    size = 1 << (MAX_ZOOM + CELL_BITS)
+    lat = max(-MAX_LAT, min(MAX_LAT, lat))
+    x = (lon + 180.0) / 360.0
+    s = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)
+    return min(size - 1, max(0, int(x * size))), min(size - 1, max(0, int(y * size)))
+
+
+def parse_bbox(value):
+    """ "west,south,east,north" (Leaflet's toBBoxString) -> floats; raises ValueError."""
+    west, south, east, north = (float(part) for part in value.split(","))
+    if not (south <= north and west <= east):
+        raise ValueError("bbox must be west,south,east,north")
+    return west, south, east, north
+
+
+class ClusterIndex:
+    def __init__(self):
+        self.version = None
+        self._points = {}                                       # id -> (lat, lon, x, y)
+        self._levels = [dict() for _ in range(MAX_ZOOM + 1)]    # zoom -> {(cx, cy): cell}
+        self._lock = threading.RLock()
+        self.rebuilds = self.updates = 0
+
+    # ---------- maintenance ----------
+
+    def rebuild(self, points, version):
+        """Replace the index with ``points``: an iterable of ``(id, lat, lon)``."""
+        with self._lock:
+            self._points = {}
+            self._levels = [dict() for _ in range(MAX_ZOOM + 1)]
+            for point_id, lat, lon in points:
+                self._add(point_id, lat, lon)
+            self.version = version
+            self.rebuilds += 1
+
+    def _add(self, point_id, lat, lon):
+        x, y = grid_xy(lat, lon)
+        self._points[point_id] = (lat, lon, x, y)
+        for zoom, level in enumerate(self._levels):
+            shift = MAX_ZOOM - zoom
+            cell = level.get((x >> shift, y >> shift))
+            if cell is None:
+                level[(x >> shift, y >> shift)] = [1, lat, lon, {point_id}]
+            else:
+                cell[0] += 1
+                cell[1] += lat
+                cell[2] += lon
+                cell[3].add(point_id)
+
+    def _remove(self, point_id):
+        point = self._points.pop(point_id, None)
+        if point is None:
+            return
+        lat, lon, x, y = point
+        for zoom, level in enumerate(self._levels):
+            key = (x >> (MAX_ZOOM - zoom), y >> (MAX_ZOOM - zoom))
+            cell = level[key]
+            if cell[0] == 1:
+                del level[key]
+            else:
+                cell[0] -= 1
+                cell[1] -= lat
+                cell[2] -= lon
+                cell[3].discard(point_id)
+
+    def apply(self, changes, base_version, version):
+        """Apply ``{id: (lat, lon) or None}`` made between ``base_version`` and ``version``."""
+        with self._lock:
+            if self.version is None or self.version != base_version:
+                self.version = None   # missed someone else's write: rebuild on next query
+                return
+            for point_id, location in changes.items():
+                self._remove(point_id)
+                if location is not None:
+                    self._add(point_id, *location)
+            self.version = version
+            self.updates += 1
+
+    # ---------- queries ----------
+
+    def query(self, bbox, zoom):
+        """Clusters overlapping ``bbox`` at ``zoom``: ``[{lat, lon, count, ids, stacked}, ...]``.
+
+        A cluster is ``stacked`` when zooming in won't split it: its groups
+        share one location (e.g. a city centroid) or ``zoom`` is already at
+        ``MAX_ZOOM``.  Stacked clusters list every id, for the client to
+        show as a list; others list the ``SAMPLE_IDS`` smallest.
+        """
+        west, south, east, north = bbox
+        zoom = max(0, min(MAX_ZOOM, zoom))
+        shift = MAX_ZOOM - zoom
+        x0, y0 = grid_xy(north, west)
+        x1, y1 = grid_xy(south, east)
+        x0, y0, x1, y1 = x0 >> shift, y0 >> shift, x1 >> shift, y1 >> shift
+
+        with self._lock:
+            level = self._levels[zoom]
+            if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(level):
+                cells = (level.get((cx, cy)) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+            else:
+                cells = (cell for (cx, cy), cell in level.items() if x0 <= cx <= x1 and y0 <= cy <= y1)
+            clusters = []
+            for count, sum_lat, sum_lon, ids in filter(None, cells):
+                stacked = count > 1 and (zoom == MAX_ZOOM or self._same_place(ids))
+                clusters.append({
+                    "lat": round(sum_lat / count, 5),
+                    "lon": round(sum_lon / count, 5),
+                    "count": count,
+                    "ids": sorted(ids) if stacked else heapq.nsmallest(SAMPLE_IDS, ids),
+                    "stacked": stacked,
+                })
+            return clusters
+
+    def _same_place(self, ids):
+        """True if every point in ``ids`` has the same coordinates (no zoom will split them)."""
+        points = self._points
+        first = None
+        for point_id in ids:
+            location = points[point_id][:2]
+            if first is None:
+                first = location
+            elif location != first:
+                return False
+        return True
+
+    # ---------- change tracking ----------
+
+    def watch(self, model, scope, is_member):
+        """Apply this process's commits to ``model`` rows; ``is_member(obj)`` says who is on the map.
+
+        The data version is read in ``after_flush``, while the transaction
+        holds SQLite's write lock, and compared with the triggers' bumps
+        this session accounts for.  Any other difference means a write the
+        session didn't see, and the index falls back to a rebuild.
+        """
+        key = f"clusters:{model.__name__}"
+
+        @event.listens_for(Session, "after_flush")
+        def _collect(session, flush_context):
+            touched = [obj for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, model)]
+            if not touched:
+                return
+            pending = session.info.setdefault(key, {"changes": {}, "bumps": 0, "version": None})
+            for obj in touched:
+                if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                    continue
+                pending["bumps"] += 1
+                member = obj not in session.deleted and is_member(obj)
+                pending["changes"][obj.id] = (obj.lat, obj.lon) if member else None
+            pending["version"] = read_versions(session, [scope])[0][scope]
+
+        @event.listens_for(Session, "after_commit")
+        def _apply(session):
+            pending = session.info.pop(key, None)
+            if pending and pending["version"] is not None:
+                base_version = pending["version"] - pending["bumps"]
+                self.apply(pending["changes"], base_version, pending["version"])
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session):
+            session.info.pop(key, None)
@@ -0,0 +1,159 @@
+"""gzip/brotli compression for responses, with a cache of compressed bodies.
+
+Registered as an ``after_request`` hook.  A response is compressed when
+the client accepts gzip or brotli (brotli needs the optional ``brotli``
+package), its type is text-like, it is at least ``COMPRESS_MIN_SIZE``
+bytes, and it isn't already encoded.  Streamed bodies of unknown length
+(CSV exports, the first build of an .ics feed) are left alone; files sent
+with ``send_file`` are compressed when they are at most
+``COMPRESS_MAX_SIZE`` bytes.
+
+Responses with a strong ETag are the same bytes every time they carry
+that ETag: the feeds' ETags follow the data versions (see versioning.py)
+and static files' follow the file.  Their compressed bodies are kept in
+an LRU keyed by ETag and encoding, bounded by ``COMPRESS_CACHE_BYTES``, so
+a hot feed is compressed once per data version.  The compressed response
+gets the ETag ``"<etag>-<encoding>"``, which conditional requests match.
+
+    COMPRESS_LEVEL        gzip level (default 6); brotli uses quality 5
+    COMPRESS_MIN_SIZE     smallest body worth compressing (default 500)
+    COMPRESS_MAX_SIZE     largest file read into memory to compress (default 4 MB)
+    COMPRESS_CACHE_BYTES  total size of cached compressed bodies (default 32 MB)
+"""
+import gzip
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from flask import request
+
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml",
+                      "image/svg+xml", "application/msgpack")
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+BROTLI_QUALITY = 5
+
+
+def is_compressible(mimetype):
+    return mimetype.startswith(COMPRESSIBLE_TYPES) or mimetype.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+class Compressor:
+    def __init__(self, app=None):
+        self.level = 6
+        self.min_size = 500
+        self.max_size = 4 * 1024 * 1024
+        self.cache_bytes = 32 * 1024 * 1024
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+        self._cache = OrderedDict()   # (etag, encoding) -> compressed body
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.skipped = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.level = int(app.config.setdefault("COMPRESS_LEVEL", os.getenv("COMPRESS_LEVEL") or self.level))
+        self.min_size = int(app.config.setdefault("COMPRESS_MIN_SIZE", os.getenv("COMPRESS_MIN_SIZE") or self.min_size))
+        self.max_size = int(app.config.setdefault("COMPRESS_MAX_SIZE", os.getenv("COMPRESS_MAX_SIZE") or self.max_size))
+        self.cache_bytes = int(app.config.setdefault("COMPRESS_CACHE_BYTES",
+                                                     os.getenv("COMPRESS_CACHE_BYTES") or self.cache_bytes))
+        app.after_request(self.after_request)
+
+    def stats(self):
+        return {
+            "encodings": list(self.encodings),
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "cached_entries": len(self._cache),
+            "cached_bytes": self._cached_bytes,
+        }
+
+    # ---------- encoding ----------
+
+    def compress(self, body, encoding):
+        if encoding == "br":
+            return brotli.compress(body, quality=BROTLI_QUALITY)
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def _peek(self, key):
+        with self._lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return compressed
+
+    def _store(self, key, compressed):
+        with self._lock:
+            if key in self._cache or len(compressed) > self.cache_bytes:
+                return
+            self._cache[key] = compressed
+            self._cached_bytes += len(compressed)
+            while self._cached_bytes > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    # ---------- hook ----------
+
+    def eligible(self, response):
+        if (request.method == "HEAD" or response.status_code != 200
+                or "Content-Encoding" in response.headers
+                or "no-transform" in response.headers.get("Cache-Control", "")
+                or not is_compressible(response.mimetype or "")):
+            return False
+        length = response.content_length
+        if length is None:
+            return not response.is_streamed   # a generator: size unknown until it's sent
+        return self.min_size <= length <= self.max_size
+
+    def after_request(self, response):
+        if not self.eligible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        etag, weak = response.get_etag()
+        tag = f"{etag}-{encoding}" if etag and not weak else None
+        if tag and request.if_none_match.contains(tag):
+            # A revalidation of the compressed copy
+            self._replace_body(response, b"")
+            response.status_code = 304
+            response.set_etag(tag)
+            response.headers.pop("Content-Length", None)
+            return response
+
+        compressed = self._peek((etag, encoding)) if tag else None
+        if compressed is None:
+            response.direct_passthrough = False   # send_file responses: read the file
+            body = response.get_data()
+            if len(body) < self.min_size:
+                self.skipped += 1
+                return response
+            compressed = self.compress(body, encoding)
+            self.misses += 1
+            if tag:
+                self._store((etag, encoding), compressed)
+
+        self._replace_body(response, compressed)
+        response.headers["Content-Encoding"] = encoding
+        if tag:
+            response.set_etag(tag)
+        return response
+
+    @staticmethod
+    def _replace_body(response, data):
+        close = getattr(response.response, "close", None)
+        if close is not None:
+            response.call_on_close(close)   # e.g. the file behind send_file
+        response.direct_passthrough = False
+        response.set_data(data)
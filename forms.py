@@ -8,8 +8,9 @@ from wtforms.validators import DataRequired, Email, Optional, Length, URL, Numbe
 
 
 def get_approved_groups():
-    from main import Catholic  # lazy import to avoid circular issue
-    return Catholic.query.filter_by(status="approved").all()
+    """``(id, name)`` of approved groups, from main's versioned cache."""
+    from main import group_choices  # lazy import to avoid circular issue
+    return group_choices()
 
 
 
@@ -0,0 +1,111 @@
+"""Full-text search over groups and events with SQLite FTS5.
+
+``catholic_fts`` and ``event_fts`` are external-content FTS5 tables: they
+store only the index and read the text back from ``catholic`` / ``event``
+by rowid.  Triggers keep them in sync (created by the migration, and by
+``install`` for databases built with ``db.create_all()``).  The
+``unicode61 remove_diacritics 2`` tokenizer folds case and accents, so
+"jose" finds "José", and the ``prefix`` index makes "bos" find "Boston"
+without a table scan.  Results are ranked with BM25.
+"""
+import re
+from collections import namedtuple
+
+from markupsafe import Markup, escape
+from sqlalchemy import DDL, Column, Integer, MetaData, Table, event, func, literal_column, text
+
+
+FtsIndex = namedtuple("FtsIndex", "name source columns weights")
+
+GROUP_INDEX = FtsIndex("catholic_fts", "catholic", ("name", "city", "group_details"), (10.0, 4.0, 1.0))
+EVENT_INDEX = FtsIndex("event_fts", "event", ("title", "description", "address"), (10.0, 1.0, 2.0))
+
+TOKENIZE = "unicode61 remove_diacritics 2"
+PREFIXES = "2 3"
+MAX_TERMS = 8
+SNIPPET_TOKENS = 12
+
+# Snippet markers that can't appear in user text; swapped for <mark> after escaping
+_OPEN, _CLOSE = "\x02", "\x03"
+
+# Kept out of the app metadata: create_all must not build these as plain tables
+fts_metadata = MetaData()
+fts_tables = {
+    index.name: Table(index.name, fts_metadata, Column("rowid", Integer, primary_key=True))
+    for index in (GROUP_INDEX, EVENT_INDEX)
+}
+
+
+def fts_ddl(index):
+    name, source, cols = index.name, index.source, ", ".join(index.columns)
+    new = ", ".join(f"NEW.{c}" for c in index.columns)
+    old = ", ".join(f"OLD.{c}" for c in index.columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({cols},"
+        f" content='{source}', content_rowid='id',"
+        f" tokenize='{TOKENIZE}', prefix='{PREFIXES}')",
+
+        f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {source} BEGIN"
+        f"  INSERT INTO {name}(rowid, {cols}) VALUES (NEW.id, {new});"
+        f" END",
+
+        f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF id, {cols} ON {source} BEGIN"
+        f"  INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', OLD.id, {old});"
+        f"  INSERT INTO {name}(rowid, {cols}) VALUES (NEW.id, {new});"
+        f" END",
+
+        f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {source} BEGIN"
+        f"  INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', OLD.id, {old});"
+        f" END",
+
+        # Index rows that existed before the table
+        f"INSERT INTO {name}({name}) VALUES ('rebuild')",
+    ]
+
+
+def install(table, index):
+    """Create ``index`` and its triggers whenever ``table`` is created."""
+    for statement in fts_ddl(index):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def match_query(text_query):
+    """User input -> FTS5 query: every word must match, each as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation typed by the user
+    are treated as text.  Returns None when there is nothing to search for.
+    """
+    terms = re.findall(r"\w+", text_query or "")[:MAX_TERMS]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def highlight(snippet):
+    """Escape a raw FTS5 snippet and turn its markers into <mark> tags."""
+    return Markup(
+        str(escape(snippet or "")).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+    )
+
+
+def search(db, model, index, text_query, limit=20, filters=()):
+    """``[(row, rank, snippet), ...]``, best match first (lower BM25 rank is better)."""
+    match = match_query(text_query)
+    if match is None:
+        return []
+
+    fts = fts_tables[index.name]
+    fts_ref = literal_column(index.name)
+    rank = func.bm25(fts_ref, *index.weights).label("rank")
+    snippet = func.snippet(fts_ref, -1, _OPEN, _CLOSE, "…", SNIPPET_TOKENS).label("snippet")
+    stmt = (
+        db.select(model, rank, snippet)
+        .join(fts, fts.c.rowid == model.id)
+        .where(text(f"{index.name} MATCH :match"), *filters)
+        .order_by(rank)
+        .limit(limit)
+    )
+    return [
+        (row, score, highlight(snip))
+        for row, score, snip in db.session.execute(stmt, {"match": match})
+    ]
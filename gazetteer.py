@@ -0,0 +1,71 @@
+"""Offline ZIP -> (lat, lon) lookups for New England.
+
+The bundled ``static/data/ne_zip_centroids.csv`` (rebuilt with
+``build_zip_gazetteer.py``) is loaded once into three parallel ``array``s
+sorted by ZIP: about 12 bytes per ZIP instead of a dict of tuples, and a
+lookup is a binary search.  No network calls.
+"""
+import csv
+import os
+import threading
+from array import array
+from bisect import bisect_left
+
+
+DEFAULT_PATH = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)), "static", "data", "ne_zip_centroids.csv"
+)
+
+
+def parse_zip(zip_code):
+    """ "02115", " 02115-1234 " -> 2115; anything else -> None. """
+    if not zip_code:
+        return None
+    digits = str(zip_code).strip().split("-")[0]
+    if len(digits) != 5 or not digits.isdigit():
+        return None
+    return int(digits)
+
+
+class ZipGazetteer:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._zips = None
+        self._lats = None
+        self._lons = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._zips is not None:
+                return
+            zips, lats, lons = array("I"), array("f"), array("f")
+            if os.path.exists(self.path):
+                with open(self.path, newline="") as f:
+                    for row in csv.DictReader(f):   # file is sorted by ZIP
+                        zips.append(int(row["zip"]))
+                        lats.append(float(row["lat"]))
+                        lons.append(float(row["lon"]))
+            self._lats, self._lons = lats, lons
+            self._zips = zips
+
+    def __len__(self):
+        if self._zips is None:
+            self._load()
+        return len(self._zips)
+
+    def lookup(self, zip_code):
+        """(lat, lon) of the ZIP's centroid, or None if it isn't a New England ZIP."""
+        key = parse_zip(zip_code)
+        if key is None:
+            return None
+        if self._zips is None:
+            self._load()
+
+        i = bisect_left(self._zips, key)
+        if i == len(self._zips) or self._zips[i] != key:
+            return None
+        return round(self._lats[i], 4), round(self._lons[i], 4)
+
+
+zip_gazetteer = ZipGazetteer()
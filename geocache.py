@@ -0,0 +1,143 @@
+"""Persistent cache in front of the OpenCage geocoder.
+
+Results are kept in a small SQLite file next to the app database (so they
+survive restarts and are shared by every worker and the scraper) with an
+in-memory LRU tier on top.  Misses are cached too, for a shorter time, so
+a typo'd city doesn't cost an API call on every retry.
+
+``CachedGeocoder.geocode`` returns the same list-of-results shape as
+``OpenCageGeocode.geocode``, so call sites don't need to change.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+DAY = 24 * 60 * 60
+
+
+def default_cache_path():
+    # Same rule as the app database: /data on Fly (mounted volume), else local file
+    if os.path.isdir("/data"):
+        return os.path.join("/data", "geocode_cache.sqlite")
+    return os.path.join(os.path.abspath(os.path.dirname(__file__)), "geocode_cache.sqlite")
+
+
+def normalize_query(query, **kwargs):
+    """ "  Boston ,MA " and "boston, ma" are the same lookup. """
+    key = re.sub(r"\s+", " ", str(query)).strip().lower()
+    key = re.sub(r"\s*,\s*", ", ", key)
+    if kwargs:
+        key += "|" + "&".join(f"{k}={kwargs[k]}" for k in sorted(kwargs))
+    return key
+
+
+def _slim(results):
+    # Only keep what the app reads: coordinates and address components
+    return [
+        {"geometry": r.get("geometry", {}), "components": r.get("components", {})}
+        for r in results[:1]
+    ]
+
+
+class CachedGeocoder:
+    def __init__(self, geocoder, path=None, ttl=90 * DAY, negative_ttl=DAY, memory_size=512):
+        self.geocoder = geocoder
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.memory_size = memory_size
+
+        self._memory = OrderedDict()   # key -> (expires_at, results)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = self.misses = 0
+
+    # ---------- storage ----------
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache ("
+                " query TEXT PRIMARY KEY,"
+                " payload TEXT,"            # NULL means a cached miss
+                " created_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key, expires_at, results):
+        with self._lock:
+            self._memory[key] = (expires_at, results)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return True, entry[1]
+                del self._memory[key]
+
+        row = self._conn().execute(
+            "SELECT payload, expires_at FROM geocode_cache WHERE query = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            return False, None
+
+        results = json.loads(row[0]) if row[0] is not None else []
+        self._remember(key, row[1], results)
+        return True, results
+
+    def _store(self, key, results):
+        now = time.time()
+        expires_at = now + (self.ttl if results else self.negative_ttl)
+        payload = json.dumps(results) if results else None
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (query, payload, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, now, expires_at),
+            )
+        self._remember(key, expires_at, results)
+
+    # ---------- public ----------
+
+    def lookup(self, query, **kwargs):
+        """Cache-only lookup: ``(found, results)`` without ever calling the API."""
+        return self._recall(normalize_query(query, **kwargs))
+
+    def geocode(self, query, **kwargs):
+        key = normalize_query(query, **kwargs)
+        found, results = self._recall(key)
+        if found:
+            self.hits += 1
+            return results
+
+        self.misses += 1
+        results = _slim(self.geocoder.geocode(query, **kwargs) or [])
+        self._store(key, results)
+        return results
+
+    def purge_expired(self):
+        conn = self._conn()
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM geocode_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+        with self._lock:
+            self._memory.clear()
+        return deleted
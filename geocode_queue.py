@@ -0,0 +1,107 @@
+"""Background geocoding for submitted groups.
+
+``submit_group`` and ``start_group`` save the ``Catholic`` row right away
+and queue a ``GeocodeJob`` (``main.enqueue_geocode``); ``flask
+geocode-worker`` drains the queue and fills in ``lat``/``lon``/``state``/
+``zip_code``.  The New England check runs here once the real state is
+known.  Transient geocoder errors (rate limits, timeouts) are retried with
+exponential backoff.
+"""
+import time
+from datetime import datetime, timedelta
+
+
+GEOCODE_PENDING = "pending"
+GEOCODE_DONE = "done"
+GEOCODE_FAILED = "failed"    # no match or out of retries -> manual review
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = timedelta(seconds=30)
+BACKOFF_MAX = timedelta(hours=6)
+
+
+def backoff_delay(attempts):
+    return min(BACKOFF_BASE * (2 ** max(attempts - 1, 0)), BACKOFF_MAX)
+
+
+def apply_geocode(group, results):
+    """Copy a geocoder result onto ``group``. Returns False if there was no match."""
+    if not results:
+        group.geocode_status = GEOCODE_FAILED
+        return False
+
+    group.lat = results[0]["geometry"]["lat"]
+    group.lon = results[0]["geometry"]["lng"]
+    components = results[0]["components"]
+    group.state = components.get("state_code", group.state)
+    group.zip_code = group.zip_code or components.get("postcode") or ""
+    group.geocode_status = GEOCODE_DONE
+    return True
+
+
+def enforce_new_england(group):
+    from main import NEW_ENGLAND_STATES  # lazy import to avoid circular issue
+
+    if group.state not in NEW_ENGLAND_STATES:
+        group.status = "rejected"
+        group.rejection_reason = "Outside New England (MA, ME, NH, VT, RI, CT)."
+        return False
+    return True
+
+
+def due_jobs_stmt(now, limit=20):
+    """Up to ``limit`` jobs whose retry time has come by ``now``, oldest first."""
+    from main import db, GeocodeJob
+
+    return (
+        db.select(GeocodeJob)
+        .where(GeocodeJob.next_attempt_at <= now)
+        .order_by(GeocodeJob.next_attempt_at)
+        .limit(limit)
+    )
+
+
+def process_due_jobs(limit=20):
+    """Run up to ``limit`` jobs whose retry time has come. Returns how many ran."""
+    from main import db, geocoder
+
+    jobs = db.session.execute(due_jobs_stmt(datetime.utcnow(), limit)).scalars().all()
+
+    for job in jobs:
+        group = job.group
+        job.attempts += 1
+        try:
+            results = geocoder.geocode(job.location)
+        except Exception as e:  # rate limit, timeout, bad gateway...
+            job.last_error = str(e)[:500]
+            if job.attempts >= MAX_ATTEMPTS:
+                group.geocode_status = GEOCODE_FAILED
+                db.session.delete(job)
+            else:
+                job.next_attempt_at = now + backoff_delay(job.attempts)
+            db.session.commit()
+            continue
+
+        apply_geocode(group, results)
+        enforce_new_england(group)
+        db.session.delete(job)
+        db.session.commit()
+
+    return len(jobs)
+
+
+def run_worker(poll_interval=5.0, once=False):
+    from flask import current_app
+
+    while True:
+        try:
+            ran = process_due_jobs()
+        except Exception:
+            current_app.logger.exception("Geocode worker batch failed")
+            from main import db
+            db.session.rollback()
+            ran = 0
+        if once:
+            return ran
+        if not ran:
+            time.sleep(poll_interval)
@@ -0,0 +1,97 @@
+"""Gunicorn settings (picked up automatically from the working directory).
+
+    GUNICORN_WORKER_CLASS   sync | gthread (default) | gevent
+    GUNICORN_WORKERS        worker processes (default: sized from CPUs and memory)
+    GUNICORN_THREADS        threads per gthread worker (default 4)
+    GUNICORN_WORKER_MEMORY_MB  memory budget per worker used for sizing (default 160)
+
+gthread is the default: SQLite and the geocoder are blocking calls, and a
+few threads per process keep one slow request from holding up the rest
+without the monkey-patching gevent needs.  gevent is optional (not in
+requirements.txt) and falls back to gthread if it isn't installed.
+"""
+import importlib.util
+import multiprocessing
+import os
+import sys
+
+
+def _cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
+def _memory_mb():
+    """Container memory limit (cgroup v2/v1) or physical memory, in MB."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:  # "max" / huge = unlimited
+            return int(value) // 1024**2
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024**2
+    except (ValueError, OSError, AttributeError):
+        return 1024
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8080")
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class == "gevent" and importlib.util.find_spec("gevent") is None:
+    print("gevent is not installed; using gthread workers")
+    worker_class = "gthread"
+
+cpus = _cpu_count()
+per_worker_mb = _env_int("GUNICORN_WORKER_MEMORY_MB", 160)
+if worker_class == "gevent":
+    default_workers = cpus  # concurrency comes from greenlets, not processes
+else:
+    default_workers = 2 * cpus + 1
+# Leave ~a quarter of the memory for the geocode worker and the page cache
+default_workers = max(1, min(default_workers, _memory_mb() * 3 // 4 // per_worker_mb))
+
+workers = _env_int("GUNICORN_WORKERS", default_workers)
+threads = _env_int("GUNICORN_THREADS", 4) if worker_class == "gthread" else 1
+worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", 100)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = 20
+keepalive = 5
+max_requests = 2000          # recycle workers to cap slow leaks
+max_requests_jitter = 200
+
+# Import main once in the master so workers share its pages copy-on-write.
+# gevent has to patch the stdlib before main is imported, so it loads per worker.
+preload_app = worker_class != "gevent"
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG")  # e.g. "-" for stdout
+errorlog = "-"
+
+
+def when_ready(server):
+    server.log.info("Serving with %d %s worker(s) x %d thread(s)", workers, worker_class, threads)
+
+
+def post_fork(server, worker):
+    """Drop pooled SQLite connections inherited from the master.
+
+    ``close=False`` leaves the master's connections alone; the child just
+    forgets them and opens its own on first use.  Without preload_app
+    nothing has been imported yet, so there is nothing to drop.
+    """
+    main = sys.modules.get("main")
+    if main is None:
+        return
+    with main.app.app_context():
+        for engine in main.db.engines.values():
+            engine.dispose(close=False)
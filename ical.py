@@ -0,0 +1,122 @@
+"""iCalendar (RFC 5545) output for events.
+
+Text values are escaped, lines are folded at 75 octets without splitting
+UTF-8 characters, and recurring events are written once with an RRULE
+instead of as pre-expanded copies.  Times are floating local times, the
+same as the event rows.
+"""
+from datetime import datetime, time, timedelta, timezone
+
+
+PRODID = "-//Catholic Groups//Event Calendar//EN"
+EVENT_DURATION = timedelta(hours=2)
+RECURRENCE_EPOCH = datetime(2024, 1, 1)   # anchor for undated series older than event.created_at
+
+
+def escape_text(value):
+    return (
+        str(value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def fold_line(line):
+    """Fold one content line to 75 octets per physical line, CRLF-terminated."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and (data[end] & 0xC0) == 0x80:  # don't split a character
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_local(moment):
+    return moment.strftime("%Y%m%dT%H%M%S")
+
+
+def format_utc(moment):
+    return moment.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def calendar_start(name=None):
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN"]
+    if name:
+        lines += ["METHOD:PUBLISH", f"X-WR-CALNAME:{escape_text(name)}"]
+    return "".join(fold_line(line) for line in lines)
+
+
+def calendar_end():
+    return fold_line("END:VCALENDAR")
+
+
+def recurrence_anchor(rule, since):
+    """DTSTART for a series: its first occurrence on or after ``since``'s date.
+
+    DTSTART is itself an occurrence, so it has to fall on the rule or
+    clients show an extra one; and it depends only on stored data, so
+    the feed doesn't change unless the event does.
+    """
+    return rule.next_occurrences(datetime.combine(since.date(), time.min), 1)[0]
+
+
+def vevent(event, dtstamp, url=None, uid_domain="catholicgroups.org"):
+    """One VEVENT for ``event`` (RRULE if recurring), or "" if it has no usable date."""
+    rule = event.recurrence
+    if rule is not None:
+        start = recurrence_anchor(rule, event.date_time or event.created_at or RECURRENCE_EPOCH)
+    elif event.date_time is not None:
+        start = event.date_time
+    else:
+        return ""
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.id}@{uid_domain}",
+        f"DTSTAMP:{format_utc(dtstamp)}",
+        f"DTSTART:{format_local(start)}",
+        f"DTEND:{format_local(start + EVENT_DURATION)}",
+    ]
+    if rule is not None:
+        lines.append(f"RRULE:{rule.to_rrule()}")
+    lines += [
+        f"SUMMARY:{escape_text(event.title)}",
+        f"DESCRIPTION:{escape_text(event.description)}",
+        f"LOCATION:{escape_text(event.address)}",
+    ]
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+
+def render_calendar(events, dtstamp, name=None, url_template=None):
+    """Yield the calendar in chunks: header, one VEVENT per event, footer.
+
+    Copies made by ``generate_future_recurrences`` are still flagged as
+    recurring; the first event of a series carries the RRULE, so later
+    copies of the same (title, group, rule) are skipped.
+    """
+    yield calendar_start(name)
+    series = set()
+    for event in events:
+        rule = event.recurrence
+        if rule is not None:
+            key = (event.title, event.group_id, rule)
+            if key in series:
+                continue
+            series.add(key)
+        chunk = vevent(event, dtstamp, url_template.format(event.id) if url_template else None)
+        if chunk:
+            yield chunk
+    yield calendar_end()
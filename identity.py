@@ -0,0 +1,78 @@
+"""Short-lived in-process cache for the logged-in user.
+
+Flask-Login calls the user loader on every request from a signed-in
+visitor.  The cache keeps a detached copy of each recently seen ``User``
+for ``ttl`` seconds and hands the request a session-bound copy with
+``Session.merge(load=False)``, which costs no query.
+
+Entries are keyed by user id and the user's session version (part of the
+id Flask-Login stores in the session), so a version change makes old
+entries unreachable.  A commit in this process that touches a ``User``
+drops that user's entry at once; other worker processes see the change
+when their entry expires.
+"""
+import threading
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+
+def detached_copy(obj):
+    """A detached instance with ``obj``'s column values and no relationships loaded."""
+    mapper = inspect(obj).mapper
+    copy = mapper.class_manager.new_instance()  # skips __init__
+    for attr in mapper.column_attrs:
+        setattr(copy, attr.key, getattr(obj, attr.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+class IdentityCache:
+    def __init__(self, ttl=60, maxsize=4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}   # id -> (version, expires_at, detached user)
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, user_id, version):
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def put(self, user_id, version, user):
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                now = time.monotonic()
+                for key in [k for k, e in self._entries.items() if e[1] <= now] or list(self._entries)[:1]:
+                    self._entries.pop(key, None)
+            self._entries[user_id] = (version, time.monotonic() + self.ttl, detached_copy(user))
+
+    def discard(self, *user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def watch(self, model):
+        """Drop a user's entry after a commit that inserted, changed or deleted it."""
+        key = f"identity:{model.__name__}"
+
+        @event.listens_for(Session, "after_flush")
+        def _collect(session, flush_context):
+            ids = {obj.id for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, model)}
+            if ids:
+                session.info.setdefault(key, set()).update(ids)
+
+        @event.listens_for(Session, "after_commit")
+        def _invalidate(session):
+            ids = session.info.pop(key, None)
+            if ids:
+                self.discard(*ids)
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session):
+            session.info.pop(key, None)
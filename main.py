@@ -1,12 +1,15 @@
 # ── Standard library
 import os
+import sqlite3
+import hashlib
 import csv
 import calendar
 from functools import wraps
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, time, timezone
 from typing import Optional, List
 
 # ── Third-party
+import click
 from dotenv import load_dotenv
 from dateutil.parser import parse as parse_datetime
 from opencage.geocoder import OpenCageGeocode
@@ -14,8 +17,10 @@ from opencage.geocoder import OpenCageGeocode
 # ── Flask core
 from flask import (
     Flask, render_template, request, redirect, url_for,
-    flash, jsonify, Response, abort, make_response, current_app
+    flash, jsonify, Response, abort, make_response, current_app, g,
+    stream_with_context
 )
+from werkzeug.utils import secure_filename
 
 # ── Flask extensions
 from flask_sqlalchemy import SQLAlchemy
@@ -28,10 +33,32 @@ from flask_wtf.csrf import CSRFProtect
 
 # ── SQLAlchemy (types for query building or ad-hoc models in this file)
 from sqlalchemy import Integer, String, Boolean, Float, DateTime, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase
+from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase, joinedload
+from sqlalchemy import and_, or_, func, literal, union_all, exists
 
 # ── App-local
 from forms import StartGroup, RegisterForm, LoginForm, EventForm, GroupForm
+from geocache import CachedGeocoder
+from geocode_queue import apply_geocode, due_jobs_stmt, run_worker, GEOCODE_PENDING
+import spatial
+from gazetteer import zip_gazetteer
+import versioning
+from versioning import conditional_feed
+from snapshots import SnapshotStore
+from recurrence import MonthlyRule, add_months, expand_many
+from calendar_feed import MonthBuckets, MAX_MONTHS
+from clusters import ClusterIndex, parse_bbox
+import ical
+import exports
+import fulltext
+import wire
+import boundaries
+import query_plans
+from identity import IdentityCache
+from passwords import PasswordHasher, PasswordHasherBusy
+from compression import Compressor
+from event_import import event_files, import_events
+from sqlite_tuning import pragma_profile, apply_pragmas, effective_pragmas, describe
 
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -40,10 +67,21 @@ from sqlalchemy.engine import Engine
 
 
 NEW_ENGLAND_STATES = {"MA", "ME", "NH", "VT", "RI", "CT"}
+ZIP_SEARCH_RADIUS_KM = 40
+EVENTS_PAGE_SIZE = 500
+SEARCH_LIMIT = 20
+ADMIN_PAGE_SIZE = 50
+BULK_ACTIONS = {"approve": "Approved", "reject": "Rejected", "delete": "Deleted"}
+BULK_FILTER_KEYS = {                         # what bulk_filters applies, per kind
+    "groups": ("status", "state"),
+    "events": ("status", "source", "group_id", "start", "end"),
+}
+ICAL_MIMETYPE = "text/calendar"  # Flask adds the utf-8 charset
 
 
 load_dotenv()
-geocoder = OpenCageGeocode(os.getenv("API_KEY"))
+# Repeat lookups ("Boston, MA") are answered from a local SQLite cache
+geocoder = CachedGeocoder(OpenCageGeocode(os.getenv("API_KEY")))
 
 
 # Load environment variables
@@ -57,7 +95,9 @@ app.config['SECRET_KEY'] = os.getenv("SECRET_KEY", "dev")
 basedir = os.path.abspath(os.path.dirname(__file__))
 data_dir = "/data"
 
-if os.path.isdir(data_dir):
+if os.getenv("DATABASE_PATH"):
+    db_path = os.getenv("DATABASE_PATH")  # tests and one-off scripts
+elif os.path.isdir(data_dir):
     os.makedirs(data_dir, exist_ok=True)  # safe no-op if it exists
     db_path = os.path.join(data_dir, "db.sqlite")
 else:
@@ -65,12 +105,20 @@ else:
 
 app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # optional tidy
+# WAL, synchronous=NORMAL, mmap, cache, busy timeout; see sqlite_tuning.py
+app.config["SQLITE_PRAGMAS"] = pragma_profile()
 
 
 
 
 csrf = CSRFProtect(app)
 
+# Logins and sign-ups hash on a capped pool; see passwords.py for the settings
+password_hasher = PasswordHasher(app)
+
+# gzip/brotli for text responses, cached by ETag; see compression.py for the settings
+compressor = Compressor(app)
+
 
 # Set up DB base and SQLAlchemy
 class Base(DeclarativeBase): pass
@@ -135,32 +183,50 @@ class User(db.Model, UserMixin):
     def __repr__(self) -> str:
         return f"<User id={self.id} email={self.email}>"
 
+    @property
+    def session_version(self) -> str:
+        # Changes with the password, which logs out every existing session
+        return hashlib.sha256(self.password.encode()).hexdigest()[:12]
+
+    def get_id(self) -> str:
+        return f"{self.id}:{self.session_version}"
+
+    def is_following(self, group_id) -> bool:
+        return db.session.execute(db.select(exists().where(
+            followers.c.user_id == self.id, followers.c.group_id == group_id
+        ))).scalar()
+
+    def is_signed_up(self, event_id) -> bool:
+        return db.session.execute(db.select(exists().where(
+            signups_table.c.user_id == self.id, signups_table.c.event_id == event_id
+        ))).scalar()
+
+
+# Logged-in users, so load_user doesn't query on every request
+user_identities = IdentityCache(ttl=60)
+user_identities.watch(User)
+
 
 @app.get("/healthz")
 def healthz():
     return "ok", 200
 
 
+@app.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(e):
+    response = make_response("Too many logins at once; please try again in a moment.", 503)
+    response.headers["Retry-After"] = "2"
+    return response
 
 
-def import_events_from_csv(file_path):
-    with open(file_path, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            date_str = f"{row['date']} {row['time']}"
-            event = Event(
-                title=row['title'],
-                date_time=datetime.strptime(date_str, "%Y-%m-%d %H:%M"),
-                address=row.get('address'),
-                zip_code=row.get('zip_code'),
-                description=row.get('description'),
-                group_id=int(row.get('group_id')),
-                link=row.get('link') or None,
-                user_id=int(row.get('user_id'))  # ⚠️ Make sure this user exists!
-            )
-            db.session.add(event)
-        db.session.commit()
-        print("✅ Events imported successfully!")
+
+
+def import_events_from_csv(file_path, **kwargs):
+    report = import_events(db, Event.__table__, Catholic, User, [file_path], **kwargs)
+    for path, line, reason in report.rejected:
+        print(f"⚠️ {path}:{line}: {reason}")
+    print(f"✅ Imported {report.inserted} events ({len(report.rejected)} rejected).")
+    return report
 
 
 
@@ -181,19 +247,39 @@ def admin_required(f):
     return decorated
 
 
+_sqlite_pragmas_reported = False
+
+
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    try:
-        cur = dbapi_connection.cursor()
-        cur.execute("PRAGMA foreign_keys=ON")
-        cur.close()
-    except Exception:
-        pass
+    global _sqlite_pragmas_reported
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    apply_pragmas(dbapi_connection, app.config["SQLITE_PRAGMAS"])
+
+    # Once per process, say what SQLite actually accepted
+    if not _sqlite_pragmas_reported:
+        _sqlite_pragmas_reported = True
+        print(f"SQLite pragmas (pid {os.getpid()}): {describe(effective_pragmas(dbapi_connection))}")
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    user_id, _, version = user_id.partition(":")
+    try:
+        user_id = int(user_id)
+    except ValueError:
+        return None
+
+    cached = user_identities.get(user_id, version)
+    if cached is not None:
+        return db.session.merge(cached, load=False)  # no query
+
+    user = db.session.get(User, user_id)
+    if user is None or user.session_version != version:
+        return None
+    user_identities.put(user_id, version, user)
+    return user
 
 
 class Catholic(db.Model):
@@ -202,7 +288,7 @@ class Catholic(db.Model):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(250), unique=True, nullable=False)
     city: Mapped[Optional[str]] = mapped_column(String(250), nullable=True)
-    state: Mapped[Optional[str]] = mapped_column(String(250), nullable=True)
+    state: Mapped[Optional[str]] = mapped_column(String(250), nullable=True, index=True)
     group_details: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     website_address: Mapped[Optional[str]] = mapped_column(String(250), nullable=True)
     social_media: Mapped[Optional[str]] = mapped_column(String(250), nullable=True)
@@ -213,9 +299,11 @@ class Catholic(db.Model):
     map_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     user_id: Mapped[Optional[int]] = mapped_column(Integer, db.ForeignKey("user.id"), nullable=True)
     rejection_reason: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    zip_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    zip_code: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
     subscribed: Mapped[bool] = mapped_column(Boolean, default=False)
-    status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)
+    status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False, index=True)
+    # pending -> queued for the background geocoder; done / failed once it has run
+    geocode_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Keep events if group is deleted: DB will SET NULL on event.group_id
     events: Mapped[List["Event"]] = relationship(
@@ -245,11 +333,43 @@ class Catholic(db.Model):
         }
 
 
+# R*Tree index over (lat, lon), maintained by triggers
+spatial.install(Catholic.__table__)
+
+
+class GeocodeJob(db.Model):
+    __tablename__ = "geocode_job"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("catholic.id", name="fk_geocode_job_group_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    location: Mapped[str] = mapped_column(String(300), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    last_error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    group: Mapped["Catholic"] = relationship()
+
+
+def enqueue_geocode(group, location):
+    """Hand ``group`` to the background geocoder (see geocode_queue.py)."""
+    group.geocode_status = GEOCODE_PENDING
+    db.session.add(GeocodeJob(group=group, location=location, next_attempt_at=datetime.utcnow()))
+
+
 # -----------------------------
 # Event model
 # -----------------------------
 class Event(db.Model):
     __tablename__ = "event"
+    __table_args__ = (
+        # Feeds filter on status or group and read in date order
+        db.Index("ix_event_status_date_time", "status", "date_time"),
+        db.Index("ix_event_group_id_date_time", "group_id", "date_time"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(120))
@@ -258,7 +378,15 @@ class Event(db.Model):
 
     address: Mapped[Optional[str]] = mapped_column(String(250))
     zip_code: Mapped[Optional[str]] = mapped_column(String(10))
-    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+    # ZIP centroid from the offline gazetteer (see locate_from_zip)
+    lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    rejection_reason: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # Where the row came from: "form", "import" or "recurrence" (NULL for older rows)
+    source: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    # Anchors DTSTART of undated recurring series in iCalendar (NULL for older rows)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, nullable=True)
 
     is_recurring: Mapped[bool] = mapped_column(Boolean, default=False)
     recurring_day: Mapped[Optional[str]] = mapped_column(String(20))
@@ -270,7 +398,6 @@ class Event(db.Model):
     # Group (nullable so we can SET NULL on delete)
     group_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("catholic.id", name="fk_event_group_id", ondelete="SET NULL"),
-        index=True,
         nullable=True,
     )
     group: Mapped["Catholic"] = relationship(back_populates="events")
@@ -287,8 +414,26 @@ class Event(db.Model):
         back_populates="signed_up_events",
     )
 
-    def to_dict(self) -> dict:
+    @property
+    def recurrence(self) -> Optional[MonthlyRule]:
+        if not self.is_recurring:
+            return None
+        default_time = self.date_time.time() if self.date_time else time(19, 0)
+        return MonthlyRule.from_fields(
+            self.recurring_week, self.recurring_day, self.recurring_time, default_time
+        )
+
+    def locate_from_zip(self):
+        coords = zip_gazetteer.lookup(self.zip_code)
+        self.lat, self.lon = coords if coords else (None, None)
+
+    def to_dict(self, ics_url_template=None) -> dict:
+        # Feeds pass ics_url_template (see ics_url_template()) instead of a url_for per row
         from flask import url_for
+        if ics_url_template:
+            ics_url = ics_url_template.format(self.id)
+        else:
+            ics_url = url_for("download_ical", event_id=self.id)
         return {
             "id": self.id,
             "title": self.title,
@@ -296,9 +441,11 @@ class Event(db.Model):
             "date_time": self.date_time.isoformat() if self.date_time else None,
             "address": self.address,
             "zip_code": self.zip_code,
+            "lat": self.lat,
+            "lon": self.lon,
             "status": self.status,
             "city": self.group.city if self.group else None,
-            "ics_url": url_for("download_ical", event_id=self.id),
+            "ics_url": ics_url,
             "is_internal": True,
             "is_recurring": self.is_recurring,
             "recurring_day": self.recurring_day,
@@ -308,28 +455,310 @@ class Event(db.Model):
         }
 
 
+def recurring_series():
+    """Recurring rows that define a series, not the dated copies generate_future_recurrences makes."""
+    return and_(Event.is_recurring.is_(True), or_(Event.source.is_(None), Event.source != "recurrence"))
+
+
+
+
+class DataVersion(db.Model):
+    """Change counter per table, bumped by triggers (see versioning.py)."""
+    __tablename__ = "data_version"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.current_timestamp(), nullable=False
+    )
+
+
+versioning.install(DataVersion.__table__, [Catholic.__table__, Event.__table__])
+
+# FTS5 indexes over group and event text, maintained by triggers
+fulltext.install(Catholic.__table__, fulltext.GROUP_INDEX)
+fulltext.install(Event.__table__, fulltext.EVENT_INDEX)
+
+# (id, name) of approved groups for form dropdowns, rebuilt when catholic changes
+approved_groups_cache = versioning.VersionedCache("catholic")
+
+
+def group_choices():
+    """Approved groups as ``(id, name)`` tuples, by name. Shared: copy before appending."""
+    def build():
+        rows = db.session.execute(
+            db.select(Catholic.id, Catholic.name)
+            .where(Catholic.status == "approved")
+            .order_by(Catholic.name)
+        )
+        return tuple((group_id, name) for group_id, name in rows)
+    return approved_groups_cache.get(db.session, build)
+
 
+# Encoded group listings ("<feed>.<format>"), rebuilt only after a Catholic row changes
+snapshots = SnapshotStore()
+snapshots.watch(Catholic)
 
+# Rendered .ics feeds ("all" and "group:<id>"), dropped whenever events change
+ical_feeds = SnapshotStore()
+ical_feeds.watch(Event)
+ical_feeds.watch(Catholic)
+
+# Map clusters over approved, geocoded groups; this process's commits are applied in place
+group_clusters = ClusterIndex()
+group_clusters.watch(
+    Catholic, "catholic",
+    lambda group: group.status == "approved" and group.lat is not None and group.lon is not None,
+)
+
+# Per-month event lists behind /api/events, keyed on the event and catholic versions
+calendar_buckets = MonthBuckets()
 
 
 # ---------- ROUTES ----------
 
+# Statements behind the busiest pages, shared with hot_queries() so the
+# query-plan check EXPLAINs exactly what the routes run
+
+def approved_groups_stmt():
+    return db.select(Catholic).where(Catholic.status == "approved")
+
+
+def map_groups_stmt():
+    """Approved groups that have been geocoded, for the map."""
+    return db.select(Catholic).where(
+        Catholic.status == "approved",
+        Catholic.lat.is_not(None), Catholic.lon.is_not(None),
+    )
+
+
+def zip_groups_stmt(zip_code):
+    return db.select(Catholic).where(Catholic.zip_code == zip_code, Catholic.status == "approved")
+
+
+def region_groups_stmt(states):
+    return db.select(Catholic).where(Catholic.state.in_(states))
+
+
 @app.route("/")
 def home():
     return render_template("index.html")
 
 @app.route("/all")
+@conditional_feed(db, "catholic", variant=wire.requested_format)
 def get_all_groups():
-    result = db.session.execute(
-        db.select(Catholic).where(Catholic.status == "approved")
+    fmt = wire.requested_format()
+
+    def build():
+        approved_groups = db.session.execute(approved_groups_stmt()).scalars().all()
+        if fmt != "json":
+            return wire.encode([group.to_dict() for group in approved_groups], wire.GROUP_FIELDS, fmt)
+        payload = {"groups": [group.to_dict() for group in approved_groups]}
+        return app.json.dumps(payload, separators=(",", ":")).encode()
+
+    snapshot = snapshots.get(f"all.{fmt}", g.data_versions["catholic"], build)
+    response = snapshots.response(snapshot, mimetype=wire.MIMETYPES[fmt])
+    response.vary.add("Accept")
+    return response
+
+def ics_url_template():
+    return url_for("download_ical", event_id=0).replace("/0/", "/{}/")
+
+
+def require_status_access(status):
+    """Only admins may read rows that aren't approved (pending, rejected, or "all")."""
+    if status != "approved" and not (current_user.is_authenticated and current_user.is_admin):
+        abort(403)
+
+
+def feed_status_access():
+    """``access`` for conditional_feed: check ?status= before any 304 and name the admin view."""
+    status = request.args.get("status", "approved")
+    require_status_access(status)
+    return None if status == "approved" else f"admin:{status}"
+
+
+def parse_feed_args(args):
+    """start/end/status/group_id query args shared by the event feeds; raises ValueError.
+
+    Aborts with 403 when a non-admin asks for anything but approved events.
+    """
+    start = parse_datetime(args["start"]) if args.get("start") else None
+    end = parse_datetime(args["end"]) if args.get("end") else None
+    group_id = int(args["group_id"]) if args.get("group_id") else None
+    status = args.get("status", "approved")
+    require_status_access(status)
+    return start, end, status, group_id
+
+
+def event_feed_filters(start, end, status, group_id):
+    filters = []
+    if status != "all":
+        filters.append(Event.status == status)
+    if group_id is not None:
+        filters.append(Event.group_id == group_id)
+    if start or end:
+        window = []
+        if start:
+            window.append(Event.date_time >= start)
+        if end:
+            window.append(Event.date_time < end)
+        # A recurring series happens in every window; its dated copies only in their own
+        filters.append(or_(and_(*window), recurring_series()))
+    return filters
+
+
+def event_feed_stmt(start, end, status, group_id, limit=EVENTS_PAGE_SIZE):
+    """One page (plus one, to see if there's more) of /data/events.json in date order."""
+    return (
+        db.select(Event)
+        .options(joinedload(Event.group).load_only(Catholic.city))  # city in the same query
+        .where(*event_feed_filters(start, end, status, group_id))
+        .order_by(Event.date_time.asc().nulls_first(), Event.id)
+        .limit(limit + 1)
     )
-    approved_groups = result.scalars().all()
-    return jsonify(groups=[group.to_dict() for group in approved_groups])
+
+
+def encode_event_cursor(event):
+    return f"{event.date_time.isoformat() if event.date_time else ''}~{event.id}"
+
+
+def event_cursor_filter(cursor):
+    """Keyset condition for rows after ``cursor`` in (date_time NULLS FIRST, id) order."""
+    when, _, last_id = cursor.rpartition("~")
+    last_id = int(last_id)
+    if not when:
+        return or_(and_(Event.date_time.is_(None), Event.id > last_id), Event.date_time.is_not(None))
+    when = datetime.fromisoformat(when)
+    return or_(Event.date_time > when, and_(Event.date_time == when, Event.id > last_id))
+
 
 @app.route("/data/events.json")
+@conditional_feed(db, "event", "catholic", variant=wire.requested_format, access=feed_status_access)
 def get_events_json():
-    events = Event.query.order_by(Event.date_time).all()
-    return jsonify([e.to_dict() for e in events])
+    fmt = wire.requested_format()
+    try:
+        start, end, status, group_id = parse_feed_args(request.args)
+        limit = min(int(request.args.get("limit", EVENTS_PAGE_SIZE)), EVENTS_PAGE_SIZE)
+        after = request.args.get("after")
+        after_filter = event_cursor_filter(after) if after else None
+    except (ValueError, OverflowError):
+        return jsonify(error="invalid start, end, group_id, limit or after"), 400
+
+    stmt = event_feed_stmt(start, end, status, group_id, limit)
+    if after_filter is not None:
+        stmt = stmt.where(after_filter)
+    events = db.session.execute(stmt).scalars().all()
+
+    template = ics_url_template()
+    rows = [e.to_dict(ics_url_template=template) for e in events[:limit]]
+    if fmt != "json":
+        response = app.response_class(wire.encode(rows, wire.EVENT_FIELDS, fmt), mimetype=wire.MIMETYPES[fmt])
+    else:
+        response = jsonify(rows)
+    response.vary.add("Accept")
+    if len(events) > limit:
+        cursor = encode_event_cursor(events[limit - 1])
+        next_args = dict(request.args, after=cursor)
+        response.headers["X-Next-Cursor"] = cursor
+        response.headers["Link"] = f'<{url_for("get_events_json", **next_args)}>; rel="next"'
+    return response
+
+def calendar_version():
+    return g.data_versions["event"], g.data_versions["catholic"]
+
+
+def calendar_item(event, ics_template, url_template, start=None):
+    """A FullCalendar event object; unknown keys end up in ``extendedProps``."""
+    item = event.to_dict(ics_url_template=ics_template)
+    item["url"] = url_template.format(event.id)
+    if start is not None:
+        item["start"] = start.isoformat()
+    return item
+
+
+def recurring_series_stmt(status):
+    return (
+        db.select(Event)
+        .options(joinedload(Event.group).load_only(Catholic.city))
+        .where(Event.status == status, recurring_series())
+    )
+
+
+def calendar_month_stmt(status, first, next_first):
+    """Dated events in [first, next_first): one-offs and generated recurrence copies."""
+    return (
+        db.select(Event)
+        .options(joinedload(Event.group).load_only(Catholic.city))
+        .where(
+            Event.status == status,
+            Event.date_time >= first, Event.date_time < next_first,
+            or_(Event.is_recurring.is_not(True), Event.source == "recurrence"),
+        )
+    )
+
+
+def recurring_templates(status, ics_template, url_template):
+    """``[(rule, first_date, (title, group_id), item), ...]`` for the recurring events to expand.
+
+    Plain values, not ``Event`` rows: the list is shared by requests in
+    every thread, long after the session that loaded it has closed.
+    Copies made by generate_future_recurrences (source "recurrence") are
+    listed as dated events instead.
+    """
+    def build():
+        events = db.session.execute(recurring_series_stmt(status)).scalars().all()
+        return [
+            (e.recurrence, e.date_time.date() if e.date_time else None, (e.title, e.group_id),
+             calendar_item(e, ics_template, url_template))
+            for e in events if e.recurrence is not None
+        ]
+    return calendar_buckets.get(("recurring", status), calendar_version(), build)
+
+
+def build_calendar_month(status, first, next_first):
+    """``[(start, item), ...]`` for one month: dated events plus recurring occurrences."""
+    ics_template = ics_url_template()
+    url_template = url_for("event_detail", event_id=0).replace("/0", "/{}")
+
+    dated = db.session.execute(calendar_month_stmt(status, first, next_first)).scalars().all()
+    items = [(e.date_time, calendar_item(e, ics_template, url_template, e.date_time)) for e in dated]
+    seen = {(e.title, e.group_id, e.date_time) for e in dated}
+
+    templates = recurring_templates(status, ics_template, url_template)
+    rules = {index: template[0] for index, template in enumerate(templates)}
+    for index, moments in expand_many(rules, first, next_first).items():
+        _, first_date, (title, group_id), item = templates[index]
+        for moment in moments:
+            if first_date and moment.date() < first_date:
+                continue  # the series hadn't started yet
+            if (title, group_id, moment) in seen:
+                continue  # already materialized as its own row
+            items.append((moment, dict(item, start=moment.isoformat())))
+
+    items.sort(key=lambda pair: (pair[0], pair[1]["id"]))
+    return items
+
+
+@app.route("/api/events")
+@conditional_feed(db, "event", "catholic", access=feed_status_access)
+def api_events():
+    """FullCalendar event source: events starting in [start, end), recurring ones expanded."""
+    try:
+        start = parse_datetime(request.args["start"]).replace(tzinfo=None)
+        end = parse_datetime(request.args["end"]).replace(tzinfo=None)
+    except (KeyError, ValueError, OverflowError):
+        return jsonify(error="start and end are required ISO dates"), 400
+    if end <= start or add_months(start, MAX_MONTHS) < end:
+        return jsonify(error=f"end must be after start and at most {MAX_MONTHS} months later"), 400
+
+    status = request.args.get("status", "approved")
+    require_status_access(status)
+    if status not in ("approved", "pending"):
+        return jsonify(error="status must be approved or pending"), 400
+
+    return jsonify(calendar_buckets.window(start, end, status, calendar_version(), build_calendar_month))
+
 
 @app.route("/disclaimer")
 def disclaimer():
@@ -337,23 +766,115 @@ def disclaimer():
 
 
 @app.route("/data/groups.json")
+@conditional_feed(db, "catholic", variant=wire.requested_format)
 def groups_json():
-    groups = Catholic.query.all()
-    return jsonify([
-        {
-            "name": g.name,
-            "description": g.group_details,
-            "lat": g.lat,
-            "lon": g.lon,
-            "city": g.city,
-            "state": g.state,
-            "website": g.website_address,
-            "social": g.social_media
-        }
-        for g in groups if g.lat and g.lon  # only return geocoded groups
+    fmt = wire.requested_format()
+
+    def build():
+        groups = db.session.execute(map_groups_stmt()).scalars().all()  # only geocoded groups
+        rows = [
+            {
+                "name": group.name,
+                "description": group.group_details,
+                "lat": group.lat,
+                "lon": group.lon,
+                "city": group.city,
+                "state": group.state,
+                "website": group.website_address,
+                "social": group.social_media
+            }
+            for group in groups
+        ]
+        if fmt != "json":
+            return wire.encode(rows, wire.MAP_FIELDS, fmt)
+        return app.json.dumps(rows, separators=(",", ":")).encode()
+
+    snapshot = snapshots.get(f"groups_json.{fmt}", g.data_versions["catholic"], build)
+    response = snapshots.response(snapshot, mimetype=wire.MIMETYPES[fmt])
+    response.vary.add("Accept")
+    return response
+
+
+@app.route("/api/groups/near")
+def groups_near():
+    try:
+        lat = float(request.args["lat"])
+        lon = float(request.args["lon"])
+        radius_km = float(request.args.get("radius_km", 25))
+        limit = int(request.args.get("limit", 50))
+    except (KeyError, ValueError):
+        return jsonify(error="lat and lon are required; radius_km and limit must be numbers"), 400
+
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180) or not (0 < radius_km <= 500) or limit < 1:
+        return jsonify(error="lat/lon out of range, or radius_km not in (0, 500]"), 400
+
+    hits = spatial.groups_near(
+        db, Catholic, lat, lon, radius_km, limit=min(limit, 500),
+        filters=(Catholic.status == "approved",),
+    )
+    return jsonify(groups=[
+        dict(group.to_dict(), distance_km=round(distance, 2)) for group, distance in hits
     ])
 
 
+@app.route("/api/groups/clusters")
+@conditional_feed(db, "catholic")
+def group_cluster_feed():
+    """Map clusters in ``bbox`` (west,south,east,north) at ``zoom``.
+
+    Single groups come with details; stacked clusters (groups zooming won't
+    separate) list each group's id, name and page so the map can show them.
+    """
+    try:
+        bbox = parse_bbox(request.args["bbox"])
+        zoom = int(request.args["zoom"])
+    except (KeyError, ValueError):
+        return jsonify(error="bbox (west,south,east,north) and zoom are required"), 400
+
+    version = g.data_versions["catholic"]
+    if group_clusters.version != version:
+        rows = db.session.execute(
+            db.select(Catholic.id, Catholic.lat, Catholic.lon).where(
+                Catholic.status == "approved",
+                Catholic.lat.is_not(None), Catholic.lon.is_not(None),
+            )
+        )
+        group_clusters.rebuild(rows, version)
+
+    clusters = group_clusters.query(bbox, zoom)
+    stacked_ids = [group_id for c in clusters if c["stacked"] for group_id in c["ids"]]
+    if stacked_ids:
+        names = dict(db.session.execute(
+            db.select(Catholic.id, Catholic.name).where(Catholic.id.in_(stacked_ids))
+        ).all())
+        for cluster in clusters:
+            if cluster["stacked"]:
+                cluster["groups"] = [
+                    {"id": group_id, "name": names.get(group_id),
+                     "url": url_for("group_detail", group_id=group_id)}
+                    for group_id in cluster["ids"]
+                ]
+
+    single_ids = [c["ids"][0] for c in clusters if c["count"] == 1]
+    if single_ids:
+        groups = db.session.execute(db.select(Catholic).where(Catholic.id.in_(single_ids))).scalars()
+        details = {
+            group.id: {
+                "name": group.name,
+                "description": group.group_details,
+                "city": group.city,
+                "state": group.state,
+                "website": group.website_address,
+                "social": group.social_media,
+            }
+            for group in groups
+        }
+        for cluster in clusters:
+            if cluster["count"] == 1:
+                cluster["group"] = details.get(cluster["ids"][0])
+    return jsonify(zoom=zoom, clusters=clusters)
+
+
 @app.route("/admin/edit/group/<int:group_id>", methods=["GET", "POST"])
 @login_required
 def edit_group(group_id):
@@ -399,9 +920,7 @@ def edit_event(event_id):
 
     # Only if your form has a group_id SelectField(coerce=int)
     if hasattr(form, "group_id"):
-        form.group_id.choices = [
-            (g.id, g.name) for g in Catholic.query.order_by(Catholic.name).all()
-        ]
+        form.group_id.choices = list(group_choices())
         if request.method == "GET":
             form.group_id.data = event.group_id
 
@@ -409,6 +928,7 @@ def edit_event(event_id):
         form.populate_obj(event)
         if hasattr(form, "group_id"):
             event.group_id = form.group_id.data
+        event.locate_from_zip()
         db.session.commit()
         flash("Event updated.", "success")
         return redirect(url_for("event_detail", event_id=event.id))
@@ -435,45 +955,20 @@ def generate_future_recurrences(event_id, months_ahead=6):
         print("Event is not set as recurring. Aborting.")
         return
 
-    week_map = {
-        "first": 0,
-        "second": 1,
-        "third": 2,
-        "fourth": 3,
-        "last": -1
-    }
-    day_map = {
-        "Monday": 0,
-        "Tuesday": 1,
-        "Wednesday": 2,
-        "Thursday": 3,
-        "Friday": 4,
-        "Saturday": 5,
-        "Sunday": 6
-    }
-
-    if event.recurring_week not in week_map or event.recurring_day not in day_map:
+    rule = event.recurrence
+    if rule is None:
         print("Invalid recurring_week or recurring_day")
         return
 
-    for i in range(1, months_ahead + 1):
-        month = (event.date_time.month + i - 1) % 12 + 1
-        year = event.date_time.year + ((event.date_time.month + i - 1) // 12)
-
-        cal = calendar.Calendar(firstweekday=calendar.SUNDAY)
-        days = [d for d in cal.itermonthdates(year, month)
-                if d.weekday() == day_map[event.recurring_day] and d.month == month]
-
-        try:
-            recur_date = days[week_map[event.recurring_week]]
-        except IndexError:
-            print(f"No {event.recurring_week} {event.recurring_day} in {month}/{year}")
-            continue
+    # The months after the event's own month (or this month, for undated rules)
+    first_month = add_months(event.date_time or datetime.now(), 1)
+    window_end = add_months(first_month, months_ahead)
 
+    for occurrence in rule.occurrences(first_month, window_end):
         new_event = Event(
             title=event.title,
             description=event.description,
-            date_time=datetime.combine(recur_date, event.date_time.time() if event.date_time else time(19, 0)),
+            date_time=occurrence,
             address=event.address,
             zip_code=event.zip_code,
             status=event.status,
@@ -482,7 +977,8 @@ def generate_future_recurrences(event_id, months_ahead=6):
             recurring_day=event.recurring_day,
             group_id=event.group_id,
             user_id=event.user_id,
-            link=event.link
+            link=event.link,
+            source="recurrence",
         )
         db.session.add(new_event)
 
@@ -504,6 +1000,7 @@ def generate_future_recurrences_route(event_id):
 @login_required
 def submit_event():
     form = EventForm()
+    form.group.choices = [*group_choices(), (-1, "Other")]  # same choices the calendar form offered
 
     if form.validate_on_submit():
         selected_group_id = form.group.data  # This is now an int (or -1)
@@ -539,7 +1036,8 @@ def submit_event():
                 address=form.address.data,
                 zip_code=form.zip_code.data,
                 user_id=current_user.id,
-                status="pending"
+                status="pending",
+                source="form",
             )
         else:
             new_event = Event(
@@ -552,9 +1050,11 @@ def submit_event():
                 address=form.address.data,
                 zip_code=form.zip_code.data,
                 user_id=current_user.id,
-                status="pending"
+                status="pending",
+                source="form",
             )
 
+        new_event.locate_from_zip()
         db.session.add(new_event)
         db.session.commit()
         return jsonify(success=True)
@@ -576,14 +1076,70 @@ def search_zip():
 
     if not zip_code:
         # Render a page that shows just the form, nothing filtered yet
-        return render_template("search_results.html", zip_code=None, groups=[])
+        return render_template("search_results.html", zip_code=None, groups=[], distances={})
+
+    approved = Catholic.status == "approved"
+
+    # Groups in that exact ZIP first (some have no coordinates yet)
+    groups = db.session.execute(zip_groups_stmt(zip_code)).scalars().all()
+    distances = {}
+
+    # Then the nearest geocoded groups around the ZIP's centroid
+    coords = zip_gazetteer.lookup(zip_code)
+    if coords:
+        exact_ids = {g.id for g in groups}
+        for group, distance in spatial.groups_near(
+            db, Catholic, coords[0], coords[1], ZIP_SEARCH_RADIUS_KM, limit=25, filters=(approved,)
+        ):
+            distances[group.id] = distance
+            if group.id not in exact_ids:
+                groups.append(group)
+
+    return render_template("search_results.html", zip_code=zip_code, groups=groups, distances=distances)
+
+
+def search_text(q, limit=SEARCH_LIMIT, kinds=("groups", "events")):
+    """BM25-ranked approved groups and events matching ``q``: {kind: [(row, rank, snippet)]}."""
+    found = {}
+    if "groups" in kinds:
+        found["groups"] = fulltext.search(
+            db, Catholic, fulltext.GROUP_INDEX, q, limit, filters=(Catholic.status == "approved",)
+        )
+    if "events" in kinds:
+        found["events"] = fulltext.search(
+            db, Event, fulltext.EVENT_INDEX, q, limit, filters=(Event.status == "approved",)
+        )
+    return found
+
 
-    # Search for groups by zip
-    groups = db.session.execute(
-        db.select(Catholic).where(Catholic.zip_code == zip_code)
-    ).scalars().all()
+@app.route("/search")
+def search():
+    q = request.args.get("q", "").strip()
+    found = search_text(q) if q else {}
+    return render_template("search.html", q=q, groups=found.get("groups", []), events=found.get("events", []))
 
-    return render_template("search_results.html", zip_code=zip_code, groups=groups)
+
+@app.get("/api/search")
+def api_search():
+    q = request.args.get("q", "").strip()
+    kind = request.args.get("type")
+    if kind not in (None, "groups", "events"):
+        return jsonify({"error": "type must be 'groups' or 'events'"}), 400
+    limit = max(1, min(request.args.get("limit", SEARCH_LIMIT, type=int), 100))
+
+    found = search_text(q, limit, (kind,) if kind else ("groups", "events"))
+    template = ics_url_template()
+    return jsonify({
+        "query": q,
+        "groups": [
+            {**group.to_dict(), "rank": rank, "snippet": str(snippet)}
+            for group, rank, snippet in found.get("groups", [])
+        ],
+        "events": [
+            {**ev.to_dict(template), "rank": rank, "snippet": str(snippet)}
+            for ev, rank, snippet in found.get("events", [])
+        ],
+    })
 
 
 
@@ -599,15 +1155,14 @@ def region_view(slug):
         "maine": ["ME"]
     }
     states = region_states.get(slug, [])
-    groups = Catholic.query.filter(Catholic.state.in_(states)).all()
+    groups = db.session.execute(region_groups_stmt(states)).scalars().all()
     return render_template("region.html", slug=slug.replace("-", " ").title(), groups=groups)
 
 
 @app.route("/calendar", methods=["GET", "POST"])
 def calendar_view():
     form = EventForm()
-    form.group.choices = [(g.id, g.name) for g in Catholic.query.all()]
-    form.group.choices.append((-1, "Other"))  # Special value for custom input
+    form.group.choices = [*group_choices(), (-1, "Other")]  # -1: special value for custom input
 
     now = datetime.now()
     year = now.year
@@ -628,17 +1183,74 @@ def calendar_view():
 
 
 @app.route("/data/groups.csv")
+@conditional_feed(db, "catholic", access=feed_status_access)
 def groups_csv():
-    groups = Catholic.query.all()
-    def generate():
-        fieldnames = ["id", "name", "city", "state", "website_address", "lat", "lon"]
-        yield ",".join(fieldnames) + "\n"
-        for g in groups:
-            row = {f: getattr(g, f, "") or "" for f in fieldnames}
-            yield ",".join(str(row[f]) for f in fieldnames) + "\n"
-    return Response(generate(), mimetype='text/csv')
+    """?status=approved (default; other statuses and "all" are admin-only)"""
+    fieldnames = ["id", "name", "city", "state", "website_address", "lat", "lon"]
+    stmt = db.select(*[getattr(Catholic, f) for f in fieldnames]).order_by(Catholic.id)
+    status = request.args.get("status", "approved")
+    require_status_access(status)
+    if status != "all":
+        stmt = stmt.where(Catholic.status == status)
+    chunks = exports.stream_rows(db.session, stmt, fieldnames, "csv")
+    return Response(stream_with_context(chunks), mimetype='text/csv')
+
+
+GROUP_EXPORT_FIELDS = [
+    "id", "name", "city", "state", "zip_code", "lat", "lon", "approximate_age_range",
+    "website_address", "social_media", "map_url", "group_details", "status",
+]
+EVENT_EXPORT_FIELDS = [
+    "id", "title", "description", "date_time", "address", "zip_code", "lat", "lon", "status",
+    "is_recurring", "recurring_week", "recurring_day", "recurring_time", "link", "group_id",
+]
+
+
+def export_response(stmt, fieldnames, fmt, filename):
+    chunks = exports.stream_rows(db.session, stmt, fieldnames, fmt)
+    response = Response(stream_with_context(chunks), mimetype=exports.FORMATS[fmt])
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}.{fmt}"
+    return response
 
-from werkzeug.security import check_password_hash
+
+@app.route("/export/groups.<fmt>")
+@conditional_feed(db, "catholic", access=feed_status_access)
+def export_groups(fmt):
+    """?state=MA&status=approved (default; "all" for every status)"""
+    if fmt not in exports.FORMATS:
+        abort(404)
+
+    stmt = db.select(*[getattr(Catholic, f) for f in GROUP_EXPORT_FIELDS]).order_by(Catholic.id)
+    status = request.args.get("status", "approved")
+    require_status_access(status)
+    if status != "all":
+        stmt = stmt.where(Catholic.status == status)
+    if request.args.get("state"):
+        stmt = stmt.where(Catholic.state == request.args["state"].upper())
+    return export_response(stmt, GROUP_EXPORT_FIELDS, fmt, "groups")
+
+
+@app.route("/export/events.<fmt>")
+@conditional_feed(db, "event", "catholic", access=feed_status_access)
+def export_events(fmt):
+    """?start=&end=&status=&group_id=&state= (state of the event's group)"""
+    if fmt not in exports.FORMATS:
+        abort(404)
+    try:
+        start, end, status, group_id = parse_feed_args(request.args)
+    except (ValueError, OverflowError):
+        return jsonify(error="invalid start, end or group_id"), 400
+
+    fieldnames = EVENT_EXPORT_FIELDS + ["group_name"]
+    stmt = (
+        db.select(*[getattr(Event, f) for f in EVENT_EXPORT_FIELDS], Catholic.name)
+        .outerjoin(Catholic, Event.group_id == Catholic.id)
+        .where(*event_feed_filters(start, end, status, group_id))
+        .order_by(Event.date_time.asc().nulls_first(), Event.id)
+    )
+    if request.args.get("state"):
+        stmt = stmt.where(Catholic.state == request.args["state"].upper())
+    return export_response(stmt, fieldnames, fmt, "events")
 
 @app.route("/login", methods=["GET", "POST"])
 def login():
@@ -647,7 +1259,11 @@ def login():
     if form.validate_on_submit():
         user = User.query.filter_by(email=form.email.data).first()
 
-        if user and check_password_hash(user.password, form.password.data):
+        if user and password_hasher.verify(user.password, form.password.data):
+            if password_hasher.needs_rehash(user.password):
+                # Made with older hash settings; upgrade while we have the plain password
+                user.password = password_hasher.hash(form.password.data)
+                db.session.commit()
             login_user(user)
             flash("✅ Logged in successfully.", "success")
             return redirect(url_for("home"))
@@ -657,8 +1273,6 @@ def login():
     return render_template("login.html", form=form)
 
 
-from werkzeug.security import generate_password_hash
-
 @app.route("/sign-up", methods=["GET", "POST"])
 def sign_up():
     form = RegisterForm()
@@ -669,7 +1283,7 @@ def sign_up():
             flash("⚠️ An account with that email already exists. Please log in or use a different email.", "warning")
             return redirect(url_for("sign_up"))
 
-        hashed_password = generate_password_hash(form.password.data)
+        hashed_password = password_hasher.hash(form.password.data)
         new_user = User(
             email=form.email.data,
             password=hashed_password,
@@ -722,41 +1336,34 @@ def submit_group():
 
         full_location = f"{form.city.data}, {form.state.data}"
 
-        # ✅ Geocode location
-        geo_result = geocoder.geocode(full_location)
-        lat = lon = None
-        state_code = form.state.data  # fallback if geocoder fails
-
-        if geo_result:
-            lat = geo_result[0]['geometry']['lat']
-            lon = geo_result[0]['geometry']['lng']
-            components = geo_result[0]['components']
-            state_code = components.get("state_code", form.state.data)
-        else:
-            flash("⚠️ Could not geocode the location. We'll still review it manually.", "warning")
-
-        # ✅ Only allow groups in New England
-        if state_code not in NEW_ENGLAND_STATES:
-            flash("❌ Sorry, we are only accepting groups from New England (MA, ME, NH, VT, RI, CT).", "danger")
-            return redirect(url_for("groups"))
-
-        # ✅ Create and save group
+        # ✅ Create the group right away; geocoding never blocks the request
         new_group = Catholic(
             name=form.name.data,
             city=form.city.data,
-            state=state_code,
+            state=form.state.data,  # fallback if geocoder fails
             zip_code=form.zip_code.data,
             website_address=form.website_address.data,
             social_media=form.social_media.data,
             map_url=form.map_url.data,
             img_url=form.img_url.data,
             group_details=form.group_details.data,
-            lat=lat,
-            lon=lon,
             user_id=current_user.id,
             status="pending"
         )
 
+        # ✅ Known locations are answered from the cache, the rest go to the worker
+        cached, geo_result = geocoder.lookup(full_location)
+        if cached:
+            if not apply_geocode(new_group, geo_result):
+                flash("⚠️ Could not geocode the location. We'll still review it manually.", "warning")
+
+            # ✅ Only allow groups in New England
+            if new_group.state not in NEW_ENGLAND_STATES:
+                flash("❌ Sorry, we are only accepting groups from New England (MA, ME, NH, VT, RI, CT).", "danger")
+                return redirect(url_for("groups"))
+        else:
+            enqueue_geocode(new_group, full_location)
+
         db.session.add(new_group)
         db.session.commit()
         flash("✅ Group submitted successfully.")
@@ -788,40 +1395,34 @@ def start_group():
     form = StartGroup()
     if form.validate_on_submit():
         full_location = f"{form.city.data}, {form.state.data} {form.zip_code.data or ''}"
-        geo_result = geocoder.geocode(full_location)
-        lat = lon = None
-        state = None
-        zip_code = form.zip_code.data or None
 
         if form.approximate_age_range.data == "Other" and form.custom_age_range.data:
             age_range = form.custom_age_range.data
         else:
             age_range = form.approximate_age_range.data
 
-        if geo_result:
-            lat = geo_result[0]['geometry']['lat']
-            lon = geo_result[0]['geometry']['lng']
-            components = geo_result[0]['components']
-            state = components.get("state_code")
-            zip_code = components.get("postcode", zip_code)
-
-            if state not in NEW_ENGLAND_STATES:
-                flash("❌ Sorry, we are currently only accepting groups based in New England (MA, ME, NH, VT, RI, CT).", "danger")
-                return redirect(url_for("start_group"))
-        else:
-            flash("Could not find location on map. We’ll still review it manually.", "warning")
-
         new_group = Catholic(
             name=form.name.data,
             city=form.city.data,
-            state=state,
-            zip_code=zip_code,
-            lat=lat,
-            lon=lon,
+            state=form.state.data,
+            zip_code=form.zip_code.data or "",  # filled from the geocoder's postcode (apply_geocode)
             user_id=current_user.id,
             status="pending",
             approximate_age_range=age_range  # ✅ This is what was missing
         )
+
+        # Cached locations are checked now; anything else is geocoded in the background
+        cached, geo_result = geocoder.lookup(full_location)
+        if cached:
+            if apply_geocode(new_group, geo_result):
+                if new_group.state not in NEW_ENGLAND_STATES:
+                    flash("❌ Sorry, we are currently only accepting groups based in New England (MA, ME, NH, VT, RI, CT).", "danger")
+                    return redirect(url_for("start_group"))
+            else:
+                flash("Could not find location on map. We’ll still review it manually.", "warning")
+        else:
+            enqueue_geocode(new_group, full_location)
+
         db.session.add(new_group)
         db.session.commit()
         return redirect(url_for("preview_group", group_id=new_group.id))
@@ -833,7 +1434,73 @@ def start_group():
 
 @app.route("/map")
 def map_view():
-    return render_template("map.html")
+    boundary_levels = [
+        {"max_zoom": level["max_zoom"], "url": url_for("boundary_file", filename=level["file"])}
+        for level in boundaries.levels()
+    ]
+    return render_template("map.html", boundary_levels=boundary_levels)
+
+
+@app.route("/boundaries/<filename>")
+def boundary_file(filename):
+    return boundaries.response(filename)
+
+
+def status_counts():
+    """{"catholic": {status: n}, "event": {status: n}} from one GROUP BY round trip."""
+    stmt = union_all(
+        db.select(literal("catholic"), Catholic.status, func.count()).group_by(Catholic.status),
+        db.select(literal("event"), Event.status, func.count()).group_by(Event.status),
+    )
+    counts = {"catholic": {}, "event": {}}
+    for scope, status, n in db.session.execute(stmt):
+        counts[scope][status] = n
+    return counts
+
+
+def pending_groups_stmt(after=None, limit=ADMIN_PAGE_SIZE):
+    """Pending groups in submission (id) order, one page past ``after``."""
+    stmt = (
+        db.select(Catholic)
+        .where(Catholic.status == "pending")
+        .order_by(Catholic.id)
+        .limit(limit + 1)
+    )
+    if after:
+        stmt = stmt.where(Catholic.id > int(after))
+    return stmt
+
+
+def pending_events_stmt(after=None, limit=ADMIN_PAGE_SIZE):
+    """Pending events by date (undated recurring ones first), one page past ``after``."""
+    stmt = (
+        db.select(Event)
+        .options(joinedload(Event.group).load_only(Catholic.name))
+        .where(Event.status == "pending")
+        .order_by(Event.date_time.asc().nulls_first(), Event.id)
+        .limit(limit + 1)
+    )
+    if after:
+        stmt = stmt.where(event_cursor_filter(after))
+    return stmt
+
+
+def keyset_page(stmt, cursor_of, limit=ADMIN_PAGE_SIZE):
+    """(rows, cursor for the next page or None) for a statement built with ``limit + 1``."""
+    rows = db.session.execute(stmt).scalars().all()
+    if len(rows) > limit:
+        return rows[:limit], cursor_of(rows[limit - 1])
+    return rows, None
+
+
+def moderation_page(kind, after):
+    """One page of pending groups or events; bad cursors are a 400."""
+    try:
+        if kind == "groups":
+            return keyset_page(pending_groups_stmt(after), lambda group: group.id)
+        return keyset_page(pending_events_stmt(after), encode_event_cursor)
+    except (ValueError, OverflowError):
+        abort(400)
 
 
 @app.route("/admin/suggested-groups")
@@ -842,11 +1509,9 @@ def suggested_groups():
     if not current_user.is_admin:
         abort(403)  # Optional access control
 
-    groups = db.session.execute(
-        db.select(Catholic).where(Catholic.status == "pending")
-    ).scalars().all()
-
-    return render_template("suggested_groups.html", groups=groups)
+    after = request.args.get("after")
+    groups, next_after = moderation_page("groups", after)
+    return render_template("suggested_groups.html", groups=groups, after=after, next_after=next_after)
 
 
 @app.route("/admin/approve/<int:group_id>", methods=["POST"])
@@ -880,9 +1545,7 @@ def reject_group(group_id):
 
 @app.route("/groups")
 def show_groups():
-    groups = db.session.execute(
-        db.select(Catholic).where(Catholic.status == "approved")
-    ).scalars().all()
+    groups = db.session.execute(approved_groups_stmt()).scalars().all()
     for group in groups:
         print(group.name, group.map_url)
 
@@ -893,116 +1556,71 @@ def show_groups():
 def download_ical(event_id):
     event = db.get_or_404(Event, event_id)
 
-    uid_base = f"{event.id}@catholicgroups.org"
-    entries = []
+    dtstamp = datetime.now(timezone.utc)
+    url = url_for("event_detail", event_id=event.id, _external=True)
+    body = ical.calendar_start() + ical.vevent(event, dtstamp, url) + ical.calendar_end()
 
-    if event.is_recurring:
-        # --- recurrence logic ---
-        weekdays = {
-            'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
-            'Friday': 4, 'Saturday': 5, 'Sunday': 6
-        }
-        week_offsets = {
-            'first': 0, 'second': 1, 'third': 2, 'fourth': 3, 'last': -1
-        }
+    response = make_response(body)
+    filename = secure_filename(f"{event.title}.ics") or "event.ics"
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    response.headers["Content-Type"] = "text/calendar; charset=utf-8"
+    return response
 
-        weekday = weekdays.get(event.recurring_day)
-        offset = week_offsets.get(event.recurring_week)
-        time_obj = datetime.strptime(event.recurring_time, "%I:%M %p").time()
 
-        for month_offset in range(3):  # generate next 3 monthly occurrences
-            today = datetime.today()
-            year = today.year + (today.month + month_offset - 1) // 12
-            month = (today.month + month_offset - 1) % 12 + 1
+def calendar_feed_stmt(group_id=None):
+    """Approved events in date order, streamed in batches, for one group or all of them."""
+    stmt = (
+        db.select(Event)
+        .where(Event.status == "approved")
+        .order_by(Event.date_time.asc().nulls_first(), Event.id)
+        .execution_options(yield_per=200)
+    )
+    if group_id:
+        stmt = stmt.where(Event.group_id == group_id)
+    return stmt
 
-            cal = calendar.Calendar().monthdatescalendar(year, month)
-            weekday_dates = [week[weekday] for week in cal if week[weekday].month == month]
 
-            if not weekday_dates:
-                continue
+def calendar_feed(group_id=None):
+    """Approved events as an iCalendar feed, cached per group until events change."""
+    versions = (g.data_versions["event"], g.data_versions["catholic"])
+    key = f"group:{group_id}" if group_id else "all"
 
-            if offset == -1:
-                event_date = weekday_dates[-1]
-            elif offset < len(weekday_dates):
-                event_date = weekday_dates[offset]
-            else:
-                continue
-
-            start = datetime.combine(event_date, time_obj)
-            end = start + timedelta(hours=2)
-
-            entries.append(f"""BEGIN:VEVENT
-UID:{event.id}-{month_offset}@catholicgroups.org
-DTSTAMP:{start.strftime('%Y%m%dT%H%M%S')}
-DTSTART:{start.strftime('%Y%m%dT%H%M%S')}
-DTEND:{end.strftime('%Y%m%dT%H%M%S')}
-SUMMARY:{event.title}
-DESCRIPTION:{event.description or ''}
-LOCATION:{event.address or ''}
-END:VEVENT
-""")
+    cached = ical_feeds.peek(key, versions)
+    if cached:
+        return ical_feeds.response(cached, mimetype=ICAL_MIMETYPE)
 
+    stmt = calendar_feed_stmt(group_id)
+    if group_id:
+        name = db.get_or_404(Catholic, group_id).name
     else:
-        # --- one-time event logic ---
-        start = event.date_time.strftime("%Y%m%dT%H%M%S")
-        end = (event.date_time + timedelta(hours=2)).strftime("%Y%m%dT%H%M%S")
-
-        entries.append(f"""BEGIN:VEVENT
-UID:{uid_base}
-DTSTAMP:{start}
-DTSTART:{start}
-DTEND:{end}
-SUMMARY:{event.title}
-DESCRIPTION:{event.description or ''}
-LOCATION:{event.address or ''}
-END:VEVENT
-""")
-
-    ical = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Catholic Groups//Event Calendar//EN
-{''.join(entries)}END:VCALENDAR
-"""
-
-    response = make_response(ical)
-    response.headers["Content-Disposition"] = f"attachment; filename={event.title}.ics"
-    response.headers["Content-Type"] = "text/calendar"
-    return response
-
-def generate_recurring_dates(start_month, year, recurring_week, recurring_day):
-    weekdays = {
-        'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
-        'Friday': 4, 'Saturday': 5, 'Sunday': 6
-    }
-    week_offsets = {
-        'first': 0, 'second': 1, 'third': 2, 'fourth': 3, 'last': -1
-    }
+        name = "Catholic Groups - New England"
 
-    weekday = weekdays[recurring_day]
-    offset = week_offsets[recurring_week]
-
-    dates = []
+    chunks = ical.render_calendar(
+        db.session.scalars(stmt),
+        dtstamp=datetime.now(timezone.utc),
+        name=name,
+        url_template=url_for("event_detail", event_id=0, _external=True)[:-1] + "{}",
+    )
+    return Response(stream_with_context(ical_feeds.stream(key, versions, chunks)), mimetype=ICAL_MIMETYPE)
 
-    for month_offset in range(3):  # next 3 months
-        month = (start_month + month_offset - 1) % 12 + 1
-        year_offset = (start_month + month_offset - 1) // 12
-        current_year = year + year_offset
 
-        # Find all days in the month that match the weekday
-        month_calendar = calendar.Calendar().monthdatescalendar(current_year, month)
-        weekday_dates = [week[weekday] for week in month_calendar if week[weekday].month == month]
+@app.route("/calendar.ics")
+@conditional_feed(db, "event", "catholic")
+def calendar_ics():
+    return calendar_feed()
 
-        if offset == -1:
-            event_date = weekday_dates[-1]
-        else:
-            if offset < len(weekday_dates):
-                event_date = weekday_dates[offset]
-            else:
-                continue  # Skip if not enough weeks in month
 
-        dates.append(event_date)
+@app.route("/group/<int:group_id>/calendar.ics")
+@conditional_feed(db, "event", "catholic")
+def group_calendar_ics(group_id):
+    return calendar_feed(group_id)
 
-    return dates
+def generate_recurring_dates(start_month, year, recurring_week, recurring_day):
+    rule = MonthlyRule.from_fields(recurring_week, recurring_day)
+    if rule is None:
+        return []
+    first_month = datetime(year, start_month, 1)
+    return [d.date() for d in rule.occurrences(first_month, add_months(first_month, 3))]  # next 3 months
 
 
 @app.route("/admin/suggested-events")
@@ -1010,10 +1628,9 @@ def generate_recurring_dates(start_month, year, recurring_week, recurring_day):
 def suggested_events():
     if not current_user.is_admin:
         abort(403)
-    events = db.session.execute(
-        db.select(Event).where(Event.status == "pending")
-    ).scalars().all()
-    return render_template("suggested_events.html", events=events)
+    after = request.args.get("after")
+    events, next_after = moderation_page("events", after)
+    return render_template("suggested_events.html", events=events, after=after, next_after=next_after)
 
 @app.route("/admin/approve-event/<int:event_id>", methods=["POST"])
 @login_required
@@ -1043,18 +1660,142 @@ def admin_dashboard():
     if not current_user.is_admin:
         abort(403)
 
-    pending_groups = db.session.execute(
-        db.select(Catholic).where(Catholic.status == "pending")
-    ).scalars().all()
+    groups_after = request.args.get("groups_after")
+    events_after = request.args.get("events_after")
+    groups, next_groups = moderation_page("groups", groups_after)
+    events, next_events = moderation_page("events", events_after)
 
-    pending_events = db.session.execute(
-        db.select(Event).where(Event.status == "pending")
-    ).scalars().all()
+    return render_template(
+        "admin_dashboard.html",
+        groups=groups,
+        events=events,
+        counts=status_counts(),
+        groups_after=groups_after,
+        events_after=events_after,
+        next_groups=next_groups,
+        next_events=next_events,
+    )
 
-    # ✅ Sort events by date_time
-    sorted_events = sorted(pending_events, key=lambda e: e.date_time)
+def parse_ids(values):
+    """["1,2", "3"] or [1, 2, 3] -> [1, 2, 3]; raises ValueError."""
+    if values is None:
+        return []
+    if isinstance(values, (str, int)):
+        values = [values]
+    ids = []
+    for value in values:
+        ids.extend(int(part) for part in str(value).split(",") if part.strip())
+    return ids
+
+
+def bulk_request_args():
+    """The bulk form fields or JSON body, with ``ids`` as a list."""
+    if request.is_json:
+        data = dict(request.get_json(silent=True) or {})
+    else:
+        data = request.form.to_dict()
+        data["ids"] = request.form.getlist("ids")
+    data["ids"] = parse_ids(data.get("ids"))
+    return data
+
+
+def bulk_filters(model, args):
+    """WHERE clauses for a bulk action: explicit ids and/or filters; raises ValueError.
+
+    ``status`` defaults to "pending" so a filter never touches rows that were
+    already moderated; pass status=any to drop it.
+    """
+    filters = []
+    if args["ids"]:
+        filters.append(model.id.in_(args["ids"]))
+    status = args.get("status") or "pending"
+    if status != "any":
+        filters.append(model.status == status)
+
+    if model is Event:
+        if args.get("source"):
+            filters.append(Event.source == args["source"])
+        if args.get("group_id"):
+            filters.append(Event.group_id == int(args["group_id"]))
+        if args.get("start"):
+            filters.append(Event.date_time >= parse_datetime(args["start"]))
+        if args.get("end"):
+            filters.append(Event.date_time < parse_datetime(args["end"]))
+    elif args.get("state"):
+        filters.append(Catholic.state == args["state"].upper())
+    return filters
+
+
+def run_bulk_action(model, action, filters, reason=None):
+    """One UPDATE or DELETE over every matching row; returns the affected count."""
+    if action == "delete":
+        stmt = db.delete(model).where(*filters)
+    elif action == "approve":
+        stmt = db.update(model).where(*filters).values(status="approved", rejection_reason=None)
+    else:
+        stmt = db.update(model).where(*filters).values(status="rejected", rejection_reason=reason or None)
+    count = db.session.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+    db.session.commit()
+    return count
+
+
+def bulk_moderate(model, kind):
+    try:
+        args = bulk_request_args()
+        filters = bulk_filters(model, args)
+    except (ValueError, OverflowError, TypeError):
+        return jsonify(error="invalid ids, group_id, start or end"), 400
+    action = args.get("action")
+    if action not in BULK_ACTIONS:
+        return jsonify(error=f"action must be one of {', '.join(BULK_ACTIONS)}"), 400
+    # A filter meant for the other kind would be dropped, widening the selection
+    supported = BULK_FILTER_KEYS[kind]
+    unsupported = sorted(key for keys in BULK_FILTER_KEYS.values() for key in keys
+                         if key not in supported and args.get(key))
+    if unsupported:
+        return jsonify(error=f"{kind} can't be filtered by {', '.join(unsupported)}"), 400
+    # An empty selection must not fall through to "every pending row"
+    if not args["ids"] and not any(args.get(key) for key in supported):
+        if request.is_json:
+            return jsonify(error="give ids or at least one filter"), 400
+        flash(f"No {kind} selected.", "warning")
+        return redirect(url_for("admin_dashboard"))
+
+    count = run_bulk_action(model, action, filters, (args.get("reason") or "").strip())
+    if request.is_json:
+        return jsonify(kind=kind, action=action, affected=count)
+    flash(f"{BULK_ACTIONS[action]} {count} {kind}.", "danger" if action == "delete" else "success")
+    return redirect(url_for("admin_dashboard"))
+
+
+@app.route("/admin/groups/bulk", methods=["POST"])
+@admin_required
+def bulk_groups():
+    """approve / reject / delete groups by ids and/or status, state."""
+    return bulk_moderate(Catholic, "groups")
+
+
+@app.route("/admin/events/bulk", methods=["POST"])
+@admin_required
+def bulk_events():
+    """approve / reject / delete events by ids and/or status, source, group_id, start, end."""
+    return bulk_moderate(Event, "events")
+
+
+@app.get("/admin/stats")
+@admin_required
+def admin_stats():
+    """In-process counters for this worker: password hashing queue and caches."""
+    return jsonify(
+        pid=os.getpid(),
+        password_hashing=password_hasher.stats(),
+        user_cache={"hits": user_identities.hits, "misses": user_identities.misses},
+        geocode_cache={"hits": geocoder.hits, "misses": geocoder.misses},
+        calendar_buckets={"hits": calendar_buckets.hits, "misses": calendar_buckets.misses},
+        group_clusters={"rebuilds": group_clusters.rebuilds, "updates": group_clusters.updates},
+        compression=compressor.stats(),
+    )
 
-    return render_template("admin_dashboard.html", groups=pending_groups, events=sorted_events)
 
 @app.route("/admin/approve_all_groups", methods=["POST"])
 @login_required
@@ -1062,14 +1803,9 @@ def approve_all_groups():
     if not current_user.is_admin:
         abort(403)
 
-    # Approve all pending groups
-    pending_groups = Catholic.query.filter_by(status="pending").all()
-    for group in pending_groups:
-        group.status = "approved"
-
-
-    db.session.commit()
-    flash(f"Approved {len(pending_groups)} groups.", "success")
+    # Approve all pending groups in one UPDATE
+    count = run_bulk_action(Catholic, "approve", [Catholic.status == "pending"])
+    flash(f"Approved {count} groups.", "success")
     return redirect(url_for("admin_dashboard"))
 
 @app.route("/admin/approve_all_events", methods=["POST"])
@@ -1078,14 +1814,9 @@ def approve_all_events():
     if not current_user.is_admin:
         abort(403)
 
-
-    # Approve all pending events
-    pending_events = Event.query.filter_by(status="pending").all()
-    for event in pending_events:
-        event.status = "approved"
-
-    db.session.commit()
-    flash(f"Approved {len(pending_events)} events.", "success")
+    # Approve all pending events in one UPDATE
+    count = run_bulk_action(Event, "approve", [Event.status == "pending"])
+    flash(f"Approved {count} events.", "success")
     return redirect(url_for("admin_dashboard"))
 
 
@@ -1138,8 +1869,8 @@ def delete_event(event_id):
 @login_required
 def follow_group(group_id):
     group = Catholic.query.get_or_404(group_id)
-    if group not in current_user.followed_groups:
-        current_user.followed_groups.append(group)
+    if not current_user.is_following(group.id):
+        db.session.execute(db.insert(followers).values(user_id=current_user.id, group_id=group.id))
         db.session.commit()
     return redirect(url_for('group_detail', group_id=group_id))
 
@@ -1147,8 +1878,8 @@ def follow_group(group_id):
 @login_required
 def signup_event(event_id):
     event = Event.query.get_or_404(event_id)
-    if event not in current_user.signed_up_events:
-        current_user.signed_up_events.append(event)
+    if not current_user.is_signed_up(event.id):
+        db.session.execute(db.insert(signups_table).values(user_id=current_user.id, event_id=event.id))
         db.session.commit()
     return redirect(url_for('event_detail', event_id=event_id))
 
@@ -1191,14 +1922,86 @@ def fix_imgs():
     return "Images updated!"
 
 
+# ---------- CLI ----------
+
+@app.cli.command("geocode-worker")
+@click.option("--interval", default=5.0, help="Seconds to sleep when the queue is empty.")
+@click.option("--once", is_flag=True, help="Run one batch of due jobs and exit.")
+def geocode_worker(interval, once):
+    """Drain the geocode job queue (runs alongside gunicorn)."""
+    ran = run_worker(poll_interval=interval, once=once)
+    if once:
+        print(f"Processed {ran} geocode jobs.")
+
+
+@app.cli.command("import-events")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", default=1000, show_default=True, help="Rows per INSERT/commit.")
+@click.option("--status", default="pending", show_default=True,
+              type=click.Choice(["pending", "approved"]), help="Status given to imported events.")
+@click.option("--dry-run", is_flag=True, help="Validate only; insert nothing.")
+def import_events_command(paths, batch_size, status, dry_run):
+    """Bulk-import events from CSV files (default: the event files in static/data)."""
+    if not paths:
+        paths = event_files(os.path.join(app.root_path, "static", "data"))
+
+    report = import_events(db, Event.__table__, Catholic, User, paths,
+                           batch_size=batch_size, status=status, dry_run=dry_run)
+    for path, reason in report.skipped_files:
+        print(f"Skipped {path}: {reason}")
+    for path, line, reason in report.rejected:
+        print(f"Rejected {path}:{line}: {reason}")
+    verb = "Validated" if dry_run else "Imported"
+    print(f"{verb} {report.inserted} events, skipped {report.duplicates} already imported, "
+          f"rejected {len(report.rejected)} in {report.seconds:.2f}s ({report.rows_per_second:,.0f} rows/s).")
+
+
+def hot_queries():
+    """The statements behind the busiest pages and feeds, for check-query-plans.
+
+    Built by the same functions the routes call, with typical arguments.
+    """
+    month = (datetime(2026, 1, 1), datetime(2026, 2, 1))
+    return {
+        "/all, /groups": approved_groups_stmt(),
+        "/data/groups.json": map_groups_stmt(),
+        "search_zip": zip_groups_stmt("02116"),
+        "region_view": region_groups_stmt(["MA"]),
+        "admin pending groups": pending_groups_stmt(after=100),
+        "admin pending events": pending_events_stmt(after="2026-01-01T00:00:00~100"),
+        "/data/events.json window": event_feed_stmt(*month, "approved", None),
+        "/api/events month": calendar_month_stmt("approved", *month),
+        "/api/events recurring": recurring_series_stmt("approved"),
+        "/calendar.ics": calendar_feed_stmt(),
+        "/group/<id>/calendar.ics": calendar_feed_stmt(1),
+        "geocode worker": due_jobs_stmt(datetime(2026, 1, 1)),
+    }
+
+
+@app.cli.command("check-query-plans")
+@click.option("--verbose", "-v", is_flag=True, help="Print every plan, not just failures.")
+def check_query_plans(verbose):
+    """EXPLAIN QUERY PLAN the hot queries; exit 1 if any does a full table scan."""
+    failed = 0
+    for label, (plan, scans) in query_plans.check(db.session, hot_queries()).items():
+        if scans:
+            failed += 1
+        if scans or verbose:
+            print(f"{'FAIL' if scans else 'ok  '} {label}")
+            for line in plan:
+                print(f"       {line}")
+        else:
+            print(f"ok   {label}")
+    if failed:
+        raise click.ClickException(f"{failed} hot queries fall back to a full scan")
+
+
 # ---------- RUN ----------
 
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
 
-        from werkzeug.security import generate_password_hash
-
         # Load admin credentials from environment
         admin_email = os.getenv("ADMIN_EMAIL", "admin@example.com")
         admin_password = os.getenv("ADMIN_PASSWORD", "adminpass")
@@ -1206,7 +2009,7 @@ if __name__ == '__main__':
         # Create default admin user if not exists
         default_user = User.query.filter_by(email=admin_email).first()
         if not default_user:
-            hashed_password = generate_password_hash(admin_password)
+            hashed_password = password_hasher.hash(admin_password)
             default_user = User(email=admin_email, password=hashed_password, is_admin=True)
             db.session.add(default_user)
             db.session.commit()
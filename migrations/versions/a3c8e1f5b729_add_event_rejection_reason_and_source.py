@@ -0,0 +1,28 @@
+"""add event.rejection_reason and event.source
+
+Revision ID: a3c8e1f5b729
+Revises: f2a7c5d9e316
+Create Date: 2026-10-18 16:48:37.502219
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c8e1f5b729'
+down_revision = 'f2a7c5d9e316'
+branch_labels = None
+depends_on = None
+
+
+# Plain ADD/DROP COLUMN (SQLite >= 3.35) instead of batch mode, which would
+# recreate event and drop the FTS and data_version triggers on it.
+def upgrade():
+    op.add_column('event', sa.Column('rejection_reason', sa.String(length=500), nullable=True))
+    op.add_column('event', sa.Column('source', sa.String(length=20), nullable=True))
+
+
+def downgrade():
+    op.drop_column('event', 'source')
+    op.drop_column('event', 'rejection_reason')
@@ -0,0 +1,45 @@
+"""add geocode job queue and catholic.geocode_status
+
+Revision ID: a41c7d2e9b10
+Revises: 2cf2208f3076
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c7d2e9b10'
+down_revision = '2cf2208f3076'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('catholic', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('geocode_status', sa.String(length=20), nullable=True))
+
+    op.create_table('geocode_job',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('location', sa.String(length=300), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['catholic.id'], name='fk_geocode_job_group_id', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('geocode_job', schema=None) as batch_op:
+        batch_op.create_index('ix_geocode_job_next_attempt_at', ['next_attempt_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('geocode_job', schema=None) as batch_op:
+        batch_op.drop_index('ix_geocode_job_next_attempt_at')
+
+    op.drop_table('geocode_job')
+
+    with op.batch_alter_table('catholic', schema=None) as batch_op:
+        batch_op.drop_column('geocode_status')
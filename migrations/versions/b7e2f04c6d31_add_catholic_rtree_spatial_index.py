@@ -0,0 +1,52 @@
+"""add catholic_rtree spatial index and sync triggers
+
+Revision ID: b7e2f04c6d31
+Revises: a41c7d2e9b10
+Create Date: 2026-10-18 10:02:15.530117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2f04c6d31'
+down_revision = 'a41c7d2e9b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS catholic_rtree"
+        " USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catholic_rtree_insert AFTER INSERT ON catholic"
+        " WHEN NEW.lat IS NOT NULL AND NEW.lon IS NOT NULL BEGIN"
+        "  INSERT INTO catholic_rtree VALUES (NEW.id, NEW.lat, NEW.lat, NEW.lon, NEW.lon);"
+        " END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catholic_rtree_update AFTER UPDATE OF id, lat, lon ON catholic BEGIN"
+        "  DELETE FROM catholic_rtree WHERE id = OLD.id;"
+        "  INSERT INTO catholic_rtree SELECT NEW.id, NEW.lat, NEW.lat, NEW.lon, NEW.lon"
+        "   WHERE NEW.lat IS NOT NULL AND NEW.lon IS NOT NULL;"
+        " END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS catholic_rtree_delete AFTER DELETE ON catholic BEGIN"
+        "  DELETE FROM catholic_rtree WHERE id = OLD.id;"
+        " END"
+    )
+    op.execute(
+        "INSERT OR REPLACE INTO catholic_rtree"
+        " SELECT id, lat, lat, lon, lon FROM catholic WHERE lat IS NOT NULL AND lon IS NOT NULL"
+    )
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS catholic_rtree_delete")
+    op.execute("DROP TRIGGER IF EXISTS catholic_rtree_update")
+    op.execute("DROP TRIGGER IF EXISTS catholic_rtree_insert")
+    op.execute("DROP TABLE IF EXISTS catholic_rtree")
@@ -0,0 +1,43 @@
+"""backfill event.source for recurrence copies made before it existed
+
+Revision ID: b9d4f7a2c615
+Revises: a3c8e1f5b729
+Create Date: 2026-10-18 19:02:44.318905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9d4f7a2c615'
+down_revision = 'a3c8e1f5b729'
+branch_labels = None
+depends_on = None
+
+
+# generate_future_recurrences copies the series' title, group and rule onto
+# each dated copy.  A recurring row with an earlier (or undated) row of the
+# same series is one of those copies; the earliest row is the series itself.
+def upgrade():
+    op.execute("""
+        UPDATE event SET source = 'recurrence'
+        WHERE source IS NULL AND is_recurring = 1 AND date_time IS NOT NULL
+          AND EXISTS (
+            SELECT 1 FROM event AS parent
+            WHERE parent.id != event.id
+              AND parent.is_recurring = 1
+              AND parent.title = event.title
+              AND parent.group_id IS event.group_id
+              AND parent.recurring_week = event.recurring_week
+              AND parent.recurring_day = event.recurring_day
+              AND (parent.date_time IS NULL
+                   OR parent.date_time < event.date_time
+                   OR (parent.date_time = event.date_time AND parent.id < event.id))
+          )
+    """)
+
+
+def downgrade():
+    # Nothing to undo: a3c8e1f5b729's downgrade drops the column
+    pass
@@ -0,0 +1,28 @@
+"""add lat/lon to event (ZIP centroid)
+
+Revision ID: c3d91a5e7f22
+Revises: b7e2f04c6d31
+Create Date: 2026-10-18 11:20:47.906512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d91a5e7f22'
+down_revision = 'b7e2f04c6d31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('event', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('lat', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('lon', sa.Float(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('event', schema=None) as batch_op:
+        batch_op.drop_column('lon')
+        batch_op.drop_column('lat')
@@ -0,0 +1,26 @@
+"""add event.created_at
+
+Revision ID: c5e2a8f1d374
+Revises: b9d4f7a2c615
+Create Date: 2026-10-18 21:14:05.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e2a8f1d374'
+down_revision = 'b9d4f7a2c615'
+branch_labels = None
+depends_on = None
+
+
+# Plain ADD/DROP COLUMN, as in a3c8e1f5b729.  SQLite can't add a column with a
+# CURRENT_TIMESTAMP default, so existing rows stay NULL and the model fills new ones.
+def upgrade():
+    op.add_column('event', sa.Column('created_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('event', 'created_at')
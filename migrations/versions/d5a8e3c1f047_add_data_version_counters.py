@@ -0,0 +1,46 @@
+"""add data_version counters and bump triggers
+
+Revision ID: d5a8e3c1f047
+Revises: c3d91a5e7f22
+Create Date: 2026-10-18 12:41:09.224871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a8e3c1f047'
+down_revision = 'c3d91a5e7f22'
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ("catholic", "event")
+
+
+def upgrade():
+    op.create_table('data_version',
+    sa.Column('scope', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('scope')
+    )
+
+    for table in VERSIONED_TABLES:
+        op.execute(
+            f"INSERT INTO data_version (scope, version, updated_at) VALUES ('{table}', 0, CURRENT_TIMESTAMP)"
+        )
+        for trigger_op in ("INSERT", "UPDATE", "DELETE"):
+            op.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_version_{trigger_op.lower()} AFTER {trigger_op} ON {table}"
+                f" BEGIN UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP"
+                f" WHERE scope = '{table}'; END"
+            )
+
+
+def downgrade():
+    for table in VERSIONED_TABLES:
+        for trigger_op in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_version_{trigger_op}")
+
+    op.drop_table('data_version')
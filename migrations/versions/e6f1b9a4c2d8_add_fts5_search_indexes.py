@@ -0,0 +1,59 @@
+"""add FTS5 full-text indexes for groups and events
+
+Revision ID: e6f1b9a4c2d8
+Revises: d5a8e3c1f047
+Create Date: 2026-10-18 15:20:44.108563
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f1b9a4c2d8'
+down_revision = 'd5a8e3c1f047'
+branch_labels = None
+depends_on = None
+
+# (fts table, content table, indexed columns)
+FTS_INDEXES = (
+    ("catholic_fts", "catholic", ("name", "city", "group_details")),
+    ("event_fts", "event", ("title", "description", "address")),
+)
+
+
+def upgrade():
+    for name, source, columns in FTS_INDEXES:
+        cols = ", ".join(columns)
+        new = ", ".join(f"NEW.{c}" for c in columns)
+        old = ", ".join(f"OLD.{c}" for c in columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({cols},"
+            f" content='{source}', content_rowid='id',"
+            f" tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {source} BEGIN"
+            f"  INSERT INTO {name}(rowid, {cols}) VALUES (NEW.id, {new});"
+            f" END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF id, {cols} ON {source} BEGIN"
+            f"  INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', OLD.id, {old});"
+            f"  INSERT INTO {name}(rowid, {cols}) VALUES (NEW.id, {new});"
+            f" END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {source} BEGIN"
+            f"  INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', OLD.id, {old});"
+            f" END"
+        )
+        op.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+
+
+def downgrade():
+    for name, source, columns in reversed(FTS_INDEXES):
+        op.execute(f"DROP TRIGGER IF EXISTS {name}_delete")
+        op.execute(f"DROP TRIGGER IF EXISTS {name}_update")
+        op.execute(f"DROP TRIGGER IF EXISTS {name}_insert")
+        op.execute(f"DROP TABLE IF EXISTS {name}")
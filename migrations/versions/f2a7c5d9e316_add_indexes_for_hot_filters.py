@@ -0,0 +1,41 @@
+"""add indexes for hot group/event filters
+
+Revision ID: f2a7c5d9e316
+Revises: e6f1b9a4c2d8
+Create Date: 2026-10-18 16:05:12.871306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a7c5d9e316'
+down_revision = 'e6f1b9a4c2d8'
+branch_labels = None
+depends_on = None
+
+
+# Plain CREATE/DROP INDEX (no batch mode): recreating catholic or event
+# would drop the R*Tree, FTS and data_version triggers on them.
+def upgrade():
+    op.create_index('ix_catholic_status', 'catholic', ['status'], unique=False)
+    op.create_index('ix_catholic_zip_code', 'catholic', ['zip_code'], unique=False)
+    op.create_index('ix_catholic_state', 'catholic', ['state'], unique=False)
+
+    op.create_index('ix_event_status_date_time', 'event', ['status', 'date_time'], unique=False)
+    op.create_index('ix_event_group_id_date_time', 'event', ['group_id', 'date_time'], unique=False)
+    # Leading columns of the composites above
+    op.drop_index('ix_event_status', table_name='event')
+    op.drop_index('ix_event_group_id', table_name='event')
+
+
+def downgrade():
+    op.create_index('ix_event_group_id', 'event', ['group_id'], unique=False)
+    op.create_index('ix_event_status', 'event', ['status'], unique=False)
+    op.drop_index('ix_event_group_id_date_time', table_name='event')
+    op.drop_index('ix_event_status_date_time', table_name='event')
+
+    op.drop_index('ix_catholic_state', table_name='catholic')
+    op.drop_index('ix_catholic_zip_code', table_name='catholic')
+    op.drop_index('ix_catholic_status', table_name='catholic')
@@ -0,0 +1,127 @@
+"""Password hashing off the request thread, with a concurrency cap.
+
+Hashing is deliberately slow and CPU-bound.  Instead of every login and
+sign-up hashing inline at once, hashes run on a small thread pool
+(``hashlib`` releases the GIL while it works), so at most
+``PASSWORD_HASH_WORKERS`` run at a time.  Up to ``PASSWORD_HASH_QUEUE``
+more wait their turn; past that ``PasswordHasherBusy`` is raised, which
+the app answers with a 503 instead of piling up threads.
+
+    PASSWORD_HASH_METHOD   werkzeug method string (default "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS  hashes at once (default: CPU count)
+    PASSWORD_HASH_QUEUE    hashes allowed to wait (default 32)
+
+Hashes made with another method are upgraded at the next successful
+login (see ``needs_rehash``).
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+DEFAULT_METHOD = "scrypt:32768:8:1"
+SALT_LENGTH = 16
+
+
+class PasswordHasherBusy(Exception):
+    """Too many hashes already running or queued."""
+
+
+class PasswordHasher:
+    def __init__(self, app=None):
+        self.method = DEFAULT_METHOD
+        self.workers = os.cpu_count() or 1
+        self.max_queue = 32
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._canonical_method = None
+
+        self.submitted = self.completed = self.rejected = 0
+        self.running = self.max_waiting = 0
+        self.total_wait = self.total_run = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.method = app.config.setdefault("PASSWORD_HASH_METHOD", os.getenv("PASSWORD_HASH_METHOD", DEFAULT_METHOD))
+        self.workers = int(app.config.setdefault("PASSWORD_HASH_WORKERS", os.getenv("PASSWORD_HASH_WORKERS") or self.workers))
+        self.max_queue = int(app.config.setdefault("PASSWORD_HASH_QUEUE", os.getenv("PASSWORD_HASH_QUEUE") or self.max_queue))
+        self._canonical_method = None
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+
+    # ---------- metrics ----------
+
+    @property
+    def waiting(self):
+        return self.submitted - self.completed - self.running
+
+    def stats(self):
+        done = self.completed or 1
+        return {
+            "method": self.method,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait / done * 1000, 2),
+            "avg_hash_ms": round(self.total_run / done * 1000, 2),
+        }
+
+    # ---------- execution ----------
+
+    def _pool(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy()
+
+        queued_at = time.perf_counter()
+        with self._lock:
+            self.max_waiting = max(self.max_waiting, self.waiting)  # already queued ahead of this one
+            self.submitted += 1
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+                self.total_wait += started - queued_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                    self.total_run += time.perf_counter() - started
+                self._slots.release()
+
+        return self._pool().submit(task).result()
+
+    # ---------- API ----------
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method, SALT_LENGTH)
+
+    def verify(self, stored_hash, password):
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        """True if ``stored_hash`` wasn't made with the configured method and parameters."""
+        if self._canonical_method is None:
+            # "scrypt" is stored as "scrypt:32768:8:1", "pbkdf2" with its default rounds, ...
+            self._canonical_method = generate_password_hash("", self.method, 1).split("$", 1)[0]
+        return stored_hash.split("$", 1)[0] != self._canonical_method
@@ -0,0 +1,31 @@
+"""EXPLAIN QUERY PLAN checks for the app's hot queries (``flask check-query-plans``).
+
+A plan line starting with ``SCAN <table>`` means SQLite reads the whole
+table (or a whole index); ``SEARCH`` means it uses an index to seek.  Scans
+of virtual tables (the R*Tree and FTS5 indexes) are how those modules
+answer their own queries, so they don't count.
+"""
+import re
+
+
+SCAN = re.compile(r"^SCAN (\S+)")
+
+
+def explain(session, stmt):
+    """The plan's detail lines for a SQLAlchemy statement, with its parameters inlined."""
+    sql = stmt.compile(dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return [row[-1] for row in rows]
+
+
+def full_scans(plan):
+    return [line for line in plan if SCAN.match(line) and "VIRTUAL TABLE" not in line]
+
+
+def check(session, queries):
+    """``{label: (plan, scans)}`` for each ``label -> statement`` in ``queries``."""
+    results = {}
+    for label, stmt in queries.items():
+        plan = explain(session, stmt)
+        results[label] = (plan, full_scans(plan))
+    return results
@@ -0,0 +1,142 @@
+"""Monthly "nth weekday" recurrence rules.
+
+Events store their schedule as ``recurring_week`` ("first" ... "fourth",
+"last"), ``recurring_day`` ("Monday" ...) and ``recurring_time``
+("6:00 PM").  ``MonthlyRule`` is the one place that turns those fields
+into dates, and it speaks the matching RRULE subset
+(``FREQ=MONTHLY;BYDAY=1MO``, ``BYDAY=-1FR`` or ``BYDAY=TH;BYSETPOS=3``)
+for iCalendar feeds.
+
+The date of a rule in a given month is pure arithmetic and memoized per
+(ordinal, weekday, month); ``expand_many`` walks each month once and
+shares the work between events that have the same rule.
+"""
+import calendar
+from collections import namedtuple
+from datetime import date, datetime, time
+from functools import lru_cache
+
+
+WEEKDAYS = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6,
+}
+WEEK_ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "last": -1}
+RRULE_DAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+DEFAULT_TIME = time(19, 0)
+TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%I %p", "%I%p", "%H:%M")
+
+
+def parse_time(value, default=DEFAULT_TIME):
+    """ "6:00 PM", "6pm", "18:00" -> time(18, 0); unparseable -> ``default``. """
+    if isinstance(value, time):
+        return value
+    text = (value or "").strip().upper().replace(".", "")
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    return default
+
+
+@lru_cache(maxsize=8192)
+def nth_weekday(year, month, weekday, ordinal):
+    """Date of the ``ordinal``-th ``weekday`` (0=Monday) in the month, or None."""
+    first_weekday, days_in_month = calendar.monthrange(year, month)
+    if ordinal > 0:
+        day = 1 + (weekday - first_weekday) % 7 + 7 * (ordinal - 1)
+    else:
+        last_weekday = (first_weekday + days_in_month - 1) % 7
+        day = days_in_month - (last_weekday - weekday) % 7 + 7 * (ordinal + 1)
+    if 1 <= day <= days_in_month:
+        return date(year, month, day)
+    return None
+
+
+def iter_months(start, end):
+    """(year, month) for every month touching [start, end)."""
+    year, month = start.year, start.month
+    while (year, month) < (end.year, end.month) or (
+        (year, month) == (end.year, end.month) and end > datetime(end.year, end.month, 1)
+    ):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def add_months(moment, months):
+    """Midnight on the 1st of the month ``months`` after ``moment``'s month."""
+    index = moment.year * 12 + moment.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+class MonthlyRule(namedtuple("MonthlyRule", "ordinal weekday at")):
+    """Every month on the ``ordinal``-th (-1 = last) ``weekday`` at time ``at``."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_fields(cls, recurring_week, recurring_day, recurring_time=None, default_time=DEFAULT_TIME):
+        if recurring_week not in WEEK_ORDINALS or recurring_day not in WEEKDAYS:
+            return None
+        return cls(WEEK_ORDINALS[recurring_week], WEEKDAYS[recurring_day],
+                   parse_time(recurring_time, default_time))
+
+    @classmethod
+    def from_rrule(cls, rrule, at=DEFAULT_TIME):
+        parts = dict(p.split("=", 1) for p in rrule.upper().removeprefix("RRULE:").split(";") if "=" in p)
+        if parts.get("FREQ") != "MONTHLY" or parts.get("INTERVAL", "1") != "1":
+            raise ValueError(f"Unsupported RRULE: {rrule}")
+
+        byday = parts.get("BYDAY", "")
+        day, prefix = byday[-2:], byday[:-2]
+        if day not in RRULE_DAYS or "," in byday:
+            raise ValueError(f"Unsupported BYDAY in RRULE: {rrule}")
+        ordinal = int(prefix or parts.get("BYSETPOS", "0"))
+        if ordinal not in WEEK_ORDINALS.values():
+            raise ValueError(f"Unsupported week ordinal in RRULE: {rrule}")
+        return cls(ordinal, RRULE_DAYS.index(day), at)
+
+    def to_rrule(self):
+        return f"FREQ=MONTHLY;BYDAY={self.ordinal}{RRULE_DAYS[self.weekday]}"
+
+    def in_month(self, year, month):
+        """The occurrence in that month as a datetime, or None (e.g. no 5th week)."""
+        day = nth_weekday(year, month, self.weekday, self.ordinal)
+        return datetime.combine(day, self.at) if day else None
+
+    def occurrences(self, start, end):
+        """Occurrences with ``start <= dt < end``, in order."""
+        found = []
+        for year, month in iter_months(start, end):
+            moment = self.in_month(year, month)
+            if moment and start <= moment < end:
+                found.append(moment)
+        return found
+
+    def next_occurrences(self, after, count):
+        """The next ``count`` occurrences at or after ``after``."""
+        found, year, month = [], after.year, after.month
+        while len(found) < count:
+            moment = self.in_month(year, month)
+            if moment and moment >= after:
+                found.append(moment)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return found
+
+
+def expand_many(rules, start, end):
+    """``{key: [datetime, ...]}`` for a ``{key: MonthlyRule}`` mapping, over [start, end)."""
+    by_rule = {}
+    for key, rule in rules.items():
+        by_rule.setdefault(rule, []).append(key)
+
+    expanded = {key: [] for key in rules}
+    for year, month in iter_months(start, end):
+        for rule, keys in by_rule.items():
+            moment = rule.in_month(year, month)
+            if moment and start <= moment < end:
+                for key in keys:
+                    expanded[key].append(moment)
+    return expanded
@@ -9,10 +9,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from dotenv import load_dotenv
 from opencage.geocoder import OpenCageGeocode
+from geocache import CachedGeocoder
 
 # Load API key
 load_dotenv()
-geocoder = OpenCageGeocode(os.getenv("API_KEY"))
+# Shares the app's geocode cache, so venues seen before cost no API calls
+geocoder = CachedGeocoder(OpenCageGeocode(os.getenv("API_KEY")))
 
 # Set up Chrome debugger connection
 options = Options()
@@ -0,0 +1,81 @@
+"""Pre-serialized snapshots of the group listings.
+
+The JSON for ``/all`` and ``/data/groups.json`` only changes when a
+``Catholic`` row does, so it is encoded once (plus a gzip copy) and
+served from memory until then.  Each snapshot remembers the ``catholic``
+data version it was built from (see versioning.py), which also catches
+writes made by other worker processes; an ``after_commit`` hook drops
+snapshots as soon as this process commits a change.
+"""
+import gzip
+import threading
+from collections import namedtuple
+
+from flask import request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+Snapshot = namedtuple("Snapshot", "version body gzip_body")
+
+
+class SnapshotStore:
+    def __init__(self):
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def peek(self, name, version):
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        return None
+
+    def put(self, name, version, body):
+        snapshot = Snapshot(version, body, gzip.compress(body, compresslevel=6, mtime=0))
+        with self._lock:
+            self._snapshots[name] = snapshot
+        return snapshot
+
+    def get(self, name, version, build):
+        """The snapshot for ``version``, building it with ``build() -> bytes`` if needed."""
+        return self.peek(name, version) or self.put(name, version, build())
+
+    def stream(self, name, version, chunks):
+        """Pass ``chunks`` (str) through, keeping the joined body once it has all been sent."""
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self.put(name, version, "".join(parts).encode())
+
+    def invalidate(self, *names):
+        with self._lock:
+            for name in names or list(self._snapshots):
+                self._snapshots.pop(name, None)
+
+    def watch(self, model, *names):
+        """Drop ``names`` (default: everything) after a commit that changed a ``model``."""
+        key = f"snapshots:{id(self)}:{model.__name__}"   # one per store: each pops its own
+
+        @event.listens_for(Session, "after_flush")
+        def _collect(session, flush_context):
+            if any(isinstance(obj, model) for obj in (*session.new, *session.dirty, *session.deleted)):
+                session.info[key] = True
+
+        @event.listens_for(Session, "after_commit")
+        def _invalidate(session):
+            if session.info.pop(key, False):
+                self.invalidate(*names)
+
+        @event.listens_for(Session, "after_rollback")
+        def _discard(session):
+            session.info.pop(key, None)
+
+    def response(self, snapshot, mimetype="application/json"):
+        if request.accept_encodings["gzip"]:
+            response = Response(snapshot.gzip_body, mimetype=mimetype)
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(snapshot.body, mimetype=mimetype)
+        response.vary.add("Accept-Encoding")
+        return response
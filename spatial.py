@@ -0,0 +1,102 @@
+"""Radius search over groups using a SQLite R*Tree index.
+
+``catholic_rtree`` holds one point box per geocoded group and is kept in
+sync with ``catholic`` by triggers (created by the migration, and by
+``install`` for databases built with ``db.create_all()``).  A query first
+asks the R*Tree for the bounding box around the point, then refines the
+handful of candidates with an exact haversine distance.
+"""
+import math
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, DDL, event
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+# Kept out of the app metadata: create_all must not build this as a plain table
+rtree_metadata = MetaData()
+catholic_rtree = Table(
+    "catholic_rtree", rtree_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("min_lat", Float),
+    Column("max_lat", Float),
+    Column("min_lon", Float),
+    Column("max_lon", Float),
+)
+
+RTREE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS catholic_rtree"
+    " USING rtree(id, min_lat, max_lat, min_lon, max_lon)",
+
+    "CREATE TRIGGER IF NOT EXISTS catholic_rtree_insert AFTER INSERT ON catholic"
+    " WHEN NEW.lat IS NOT NULL AND NEW.lon IS NOT NULL BEGIN"
+    "  INSERT INTO catholic_rtree VALUES (NEW.id, NEW.lat, NEW.lat, NEW.lon, NEW.lon);"
+    " END",
+
+    "CREATE TRIGGER IF NOT EXISTS catholic_rtree_update AFTER UPDATE OF id, lat, lon ON catholic BEGIN"
+    "  DELETE FROM catholic_rtree WHERE id = OLD.id;"
+    "  INSERT INTO catholic_rtree SELECT NEW.id, NEW.lat, NEW.lat, NEW.lon, NEW.lon"
+    "   WHERE NEW.lat IS NOT NULL AND NEW.lon IS NOT NULL;"
+    " END",
+
+    "CREATE TRIGGER IF NOT EXISTS catholic_rtree_delete AFTER DELETE ON catholic BEGIN"
+    "  DELETE FROM catholic_rtree WHERE id = OLD.id;"
+    " END",
+
+    # Backfill rows that existed before the index
+    "INSERT OR REPLACE INTO catholic_rtree"
+    " SELECT id, lat, lat, lon, lon FROM catholic WHERE lat IS NOT NULL AND lon IS NOT NULL",
+]
+
+
+# The triggers go with the table; the virtual table would outlive it with stale rows
+RTREE_DROP_DDL = "DROP TABLE IF EXISTS catholic_rtree"
+
+
+def install(table):
+    """Create the R*Tree and its triggers whenever ``table`` is created; drop it with ``table``."""
+    for statement in RTREE_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(table, "after_drop", DDL(RTREE_DROP_DDL).execute_if(dialect="sqlite"))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat, lon, radius_km):
+    """(min_lat, max_lat, min_lon, max_lon) enclosing the circle."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat <= 1e-9 or radius_km / (KM_PER_DEGREE_LAT * cos_lat) >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    dlon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    return min_lat, max_lat, lon - dlon, lon + dlon
+
+
+def groups_near(db, model, lat, lon, radius_km, limit=None, filters=()):
+    """``[(group, distance_km), ...]`` within ``radius_km``, nearest first."""
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_km)
+    r = catholic_rtree.c
+    stmt = (
+        db.select(model)
+        .join(catholic_rtree, r.id == model.id)
+        .where(r.max_lat >= min_lat, r.min_lat <= max_lat,
+               r.max_lon >= min_lon, r.min_lon <= max_lon, *filters)
+    )
+
+    hits = []
+    for group in db.session.execute(stmt).scalars():
+        distance = haversine_km(lat, lon, group.lat, group.lon)
+        if distance <= radius_km:
+            hits.append((group, distance))
+
+    hits.sort(key=lambda hit: hit[1])
+    return hits[:limit] if limit else hits
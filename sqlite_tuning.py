@@ -0,0 +1,81 @@
+"""SQLite connection pragmas.
+
+Every new connection gets the profile in ``app.config["SQLITE_PRAGMAS"]``.
+The defaults put the database in WAL mode, so readers keep going while a
+write is in progress, relax fsync to ``synchronous=NORMAL`` (safe in WAL;
+a power cut can lose the last commits but not corrupt the file), and give
+each connection a memory-mapped read window, a bigger page cache and a
+busy timeout so concurrent writers wait instead of failing with
+"database is locked".
+
+Each pragma can be overridden with an ``SQLITE_<NAME>`` environment
+variable, e.g. ``SQLITE_MMAP_SIZE=0`` or ``SQLITE_JOURNAL_MODE=DELETE``.
+"""
+import os
+import sqlite3
+
+
+DEFAULT_PRAGMAS = {
+    "busy_timeout": 5000,        # ms
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "cache_size": -20000,        # negative = KiB, so ~20 MB per connection
+    "mmap_size": 128 * 1024**2,  # bytes
+    "temp_store": "MEMORY",
+}
+
+# busy_timeout first so that switching journal_mode waits for a lock instead of failing
+PRAGMA_ORDER = tuple(DEFAULT_PRAGMAS)
+
+# Pragmas that read back as numbers
+READBACK_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+    "foreign_keys": {0: "OFF", 1: "ON"},
+}
+
+
+def pragma_profile(overrides=None, environ=os.environ):
+    """Defaults, then ``overrides`` (a dict), then ``SQLITE_*`` environment variables."""
+    profile = dict(DEFAULT_PRAGMAS)
+    profile.update(overrides or {})
+    for name in list(profile):
+        value = environ.get(f"SQLITE_{name.upper()}")
+        if value is not None:
+            profile[name] = value
+    return profile
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    """Run ``PRAGMA name=value`` for each setting; no-op for non-SQLite connections."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    names = sorted(pragmas, key=lambda n: PRAGMA_ORDER.index(n) if n in PRAGMA_ORDER else len(PRAGMA_ORDER))
+    cur = dbapi_connection.cursor()
+    try:
+        for name in names:
+            if not name.isidentifier():
+                raise ValueError(f"Bad SQLite pragma name: {name!r}")
+            cur.execute(f"PRAGMA {name}={pragmas[name]}")
+            cur.fetchall()  # journal_mode / mmap_size answer with a row
+    finally:
+        cur.close()
+
+
+def effective_pragmas(dbapi_connection, names=PRAGMA_ORDER):
+    """What the connection actually ended up with (e.g. WAL falls back to DELETE on :memory:)."""
+    cur = dbapi_connection.cursor()
+    try:
+        settings = {}
+        for name in names:
+            row = cur.execute(f"PRAGMA {name}").fetchone()
+            value = row[0] if row else None
+            settings[name] = READBACK_NAMES.get(name, {}).get(value, value)
+        return settings
+    finally:
+        cur.close()
+
+
+def describe(settings):
+    return ", ".join(f"{name}={value}" for name, value in settings.items())
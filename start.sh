@@ -0,0 +1,16 @@
+#!/bin/sh
+# Container entrypoint: gunicorn plus the geocode worker.
+#
+# The worker shares the /data volume with the app, so both run on the same
+# machine.  It runs under a restart loop: if it crashes or is killed, the
+# exit is logged and it comes back, instead of the queue silently backing up.
+
+(
+  while true; do
+    .venv/bin/flask geocode-worker
+    echo "geocode-worker exited with status $?; restarting in 5s" >&2
+    sleep 5
+  done
+) &
+
+exec .venv/bin/gunicorn main:app
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# main reads these at import time
+os.environ.setdefault("API_KEY", "test")
+TMP = tempfile.mkdtemp(prefix="necatholic-")
+os.environ["DATABASE_PATH"] = os.path.join(TMP, "test.db")
+
+import main  # noqa: E402
+from main import db  # noqa: E402
+
+main.geocoder.path = os.path.join(TMP, "geocode_cache.sqlite")   # opened on first lookup
+
+
+def reset_caches():
+    """Process-wide caches are keyed on data versions, which restart with the schema."""
+    main.snapshots.invalidate()
+    main.ical_feeds.invalidate()
+    main.calendar_buckets._buckets.clear()
+    main.group_clusters.version = None
+    main.approved_groups_cache._version = None
+    main.user_identities._entries.clear()
+
+
+@pytest.fixture
+def app():
+    """A fresh schema per test.  No app context stays pushed, so each request gets its own ``g``."""
+    main.app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with main.app.app_context():
+        db.drop_all()
+        db.create_all()
+    reset_caches()
+    yield main.app
+    with main.app.app_context():
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def add(app):
+    """``add(Model, **fields)`` commits one row and returns its id."""
+    def add(model, **fields):
+        with app.app_context():
+            row = model(**fields)
+            db.session.add(row)
+            db.session.commit()
+            return row.id
+    return add
+
+
+@pytest.fixture
+def admin_id(add):
+    return add(main.User, email="admin@example.com", password=main.password_hasher.hash("pw"), is_admin=True)
+
+
+@pytest.fixture
+def admin_client(client, admin_id):
+    client.post("/login", data={"email": "admin@example.com", "password": "pw"})
+    return client
+
+
+@pytest.fixture
+def add_group(add):
+    def add_group(**fields):
+        values = dict(name="St. Anne Young Adults", city="Boston", state="MA", zip_code="02116",
+                      status="approved", lat=42.35, lon=-71.06)
+        values.update(fields)
+        return add(main.Catholic, **values)
+    return add_group
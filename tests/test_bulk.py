@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from main import Catholic, Event, db
+
+
+@pytest.fixture
+def pending(add, add_group, admin_id):
+    """Two pending groups (MA, VT) and two pending events (imported, submitted)."""
+    groups = [add_group(name="Boston", status="pending"),
+              add_group(name="Burlington", state="VT", status="pending")]
+    events = [add(Event, title="Imported", status="pending", source="import", user_id=admin_id,
+                  date_time=datetime(2026, 10, 1, 19)),
+              add(Event, title="Submitted", status="pending", user_id=admin_id,
+                  date_time=datetime(2026, 11, 1, 19))]
+    return groups, events
+
+
+def statuses(app, model):
+    with app.app_context():
+        return dict(db.session.execute(db.select(model.title if model is Event else model.name,
+                                                 model.status)).all())
+
+
+@pytest.mark.parametrize("kind, body", [
+    ("groups", {"action": "delete", "source": "import"}),
+    ("groups", {"action": "delete", "group_id": "1"}),
+    ("groups", {"action": "approve", "start": "2026-01-01"}),
+    ("events", {"action": "reject", "state": "VT"}),
+])
+def test_filters_for_the_other_kind_are_refused(app, admin_client, pending, kind, body):
+    response = admin_client.post(f"/admin/{kind}/bulk", json=body)
+    assert response.status_code == 400
+    assert set(statuses(app, Catholic).values()) == {"pending"}
+    assert set(statuses(app, Event).values()) == {"pending"}
+
+
+@pytest.mark.parametrize("kind", ["groups", "events"])
+def test_empty_selection_is_refused(admin_client, pending, kind):
+    assert admin_client.post(f"/admin/{kind}/bulk", json={"action": "delete"}).status_code == 400
+
+
+def test_groups_by_state(app, admin_client, pending):
+    response = admin_client.post("/admin/groups/bulk", json={"action": "approve", "state": "vt"})
+    assert response.json == {"kind": "groups", "action": "approve", "affected": 1}
+    assert statuses(app, Catholic) == {"Boston": "pending", "Burlington": "approved"}
+
+
+def test_events_by_source(app, admin_client, pending):
+    response = admin_client.post("/admin/events/bulk",
+                                 json={"action": "reject", "source": "import", "reason": "dupe"})
+    assert response.json["affected"] == 1
+    assert statuses(app, Event) == {"Imported": "rejected", "Submitted": "pending"}
+
+
+def test_events_by_ids(app, admin_client, pending):
+    _, events = pending
+    response = admin_client.post("/admin/events/bulk", json={"action": "delete", "ids": [events[1]]})
+    assert response.json["affected"] == 1
+    assert statuses(app, Event) == {"Imported": "pending"}
+
+
+def test_bulk_requires_admin(client, pending):
+    response = client.post("/admin/groups/bulk", json={"action": "delete", "state": "MA"})
+    assert response.status_code in (302, 401, 403)
@@ -0,0 +1,51 @@
+import os
+from datetime import datetime
+
+from flask_migrate import stamp, upgrade
+
+import main
+from conftest import ROOT
+from main import Event, db
+
+WINDOW = "/api/events?start=2026-09-27&end=2026-12-06"
+
+
+def add_series(add, admin_id, source=None):
+    """A first-Friday series plus two copies as generate_future_recurrences made them before ``source``."""
+    fields = dict(title="Holy Hour", status="approved", user_id=admin_id, is_recurring=True,
+                  recurring_week="first", recurring_day="Friday", recurring_time="7:00 PM")
+    add(Event, date_time=datetime(2026, 10, 2, 19), source=source, **fields)
+    add(Event, date_time=datetime(2026, 11, 6, 19), source=None, **fields)
+    add(Event, date_time=datetime(2026, 12, 4, 19), source=None, **fields)
+
+
+def starts(client):
+    return [e["start"] for e in client.get(WINDOW).json]
+
+
+def test_recurring_series_expands_once_per_month(client, add, admin_id):
+    fields = dict(title="Rosary", status="approved", user_id=admin_id, is_recurring=True,
+                  recurring_week="last", recurring_day="Monday")
+    add(Event, **fields)
+    assert starts(client) == ["2026-09-28T19:00:00", "2026-10-26T19:00:00", "2026-11-30T19:00:00"]
+
+
+def test_legacy_recurrence_copies_are_backfilled(app, client, add, admin_id):
+    add_series(add, admin_id)
+    with app.app_context():
+        stamp(os.path.join(ROOT, "migrations"), "a3c8e1f5b729")
+        upgrade(os.path.join(ROOT, "migrations"), "b9d4f7a2c615")
+        sources = db.session.execute(db.select(Event.source).order_by(Event.id)).scalars().all()
+    assert sources == [None, "recurrence", "recurrence"]
+    assert starts(client) == ["2026-10-02T19:00:00", "2026-11-06T19:00:00", "2026-12-04T19:00:00"]
+
+
+def test_cached_buckets_hold_no_orm_rows(client, add, admin_id):
+    add_series(add, admin_id, source="form")
+    first = client.get(WINDOW).json
+    assert client.get(WINDOW).json == first   # second request: buckets built by another session
+
+    for _, bucket in main.calendar_buckets._buckets.values():
+        for entry in bucket:
+            values = entry if isinstance(entry, tuple) else (entry,)
+            assert not any(isinstance(value, Event) for value in values)
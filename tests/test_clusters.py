@@ -0,0 +1,40 @@
+import pytest
+
+BBOX = "-72,42,-70,43"
+
+
+@pytest.mark.parametrize("zoom", [6, 12, 16, 18])
+def test_groups_in_the_same_city_are_listed(client, add_group, zoom):
+    first = add_group(name="St. Anne Young Adults")
+    second = add_group(name="Cathedral Young Professionals")
+
+    clusters = client.get(f"/api/groups/clusters?bbox={BBOX}&zoom={zoom}").json["clusters"]
+
+    assert len(clusters) == 1
+    cluster = clusters[0]
+    assert cluster["count"] == 2 and cluster["stacked"]
+    assert cluster["groups"] == [
+        {"id": first, "name": "St. Anne Young Adults", "url": f"/group/{first}"},
+        {"id": second, "name": "Cathedral Young Professionals", "url": f"/group/{second}"},
+    ]
+
+
+def test_nearby_groups_split_when_zoomed_in(client, add_group):
+    add_group(name="Back Bay", lat=42.350, lon=-71.080)
+    add_group(name="North End", lat=42.365, lon=-71.055)
+
+    wide = client.get(f"/api/groups/clusters?bbox={BBOX}&zoom=6").json["clusters"]
+    assert [(c["count"], c["stacked"]) for c in wide] == [(2, False)]
+    assert "groups" not in wide[0]
+
+    close = client.get(f"/api/groups/clusters?bbox={BBOX}&zoom=14").json["clusters"]
+    assert sorted(c["group"]["name"] for c in close) == ["Back Bay", "North End"]
+
+
+def test_max_zoom_lists_groups_a_few_metres_apart(client, add_group):
+    add_group(name="Chapel", lat=42.350000, lon=-71.060000)
+    add_group(name="Hall", lat=42.350001, lon=-71.060001)
+
+    clusters = client.get(f"/api/groups/clusters?bbox={BBOX}&zoom=18").json["clusters"]
+    assert [(c["count"], c["stacked"]) for c in clusters] == [(2, True)]
+    assert [group["name"] for group in clusters[0]["groups"]] == ["Chapel", "Hall"]
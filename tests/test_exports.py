@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from main import Event
+
+
+@pytest.fixture
+def rows(add, add_group, admin_id):
+    add_group(name="Approved Group")
+    add_group(name="Pending Group", status="pending")
+    add(Event, title="Pending Event", status="pending", user_id=admin_id, date_time=datetime(2026, 10, 1, 19))
+
+
+@pytest.mark.parametrize("kind", ["groups", "events"])
+@pytest.mark.parametrize("status", ["pending", "rejected", "all"])
+def test_anonymous_unmoderated_exports_are_refused(client, rows, kind, status):
+    assert client.get(f"/export/{kind}.csv?status={status}").status_code == 403
+
+
+@pytest.mark.parametrize("status", ["pending", "rejected", "all"])
+def test_anonymous_unmoderated_groups_csv_is_refused(client, rows, status):
+    assert client.get(f"/data/groups.csv?status={status}").status_code == 403
+
+
+@pytest.mark.parametrize("url", ["/export/groups.csv", "/data/groups.csv"])
+def test_anonymous_export_has_only_approved_groups(client, rows, url):
+    body = client.get(url).get_data(as_text=True)
+    assert "Approved Group" in body and "Pending Group" not in body
+
+
+def test_admin_can_export_unmoderated(admin_client, rows):
+    assert "Pending Group" in admin_client.get("/export/groups.csv?status=pending").get_data(as_text=True)
+    assert "Pending Event" in admin_client.get("/export/events.csv?status=pending").get_data(as_text=True)
+    assert "Pending Group" in admin_client.get("/data/groups.csv?status=all").get_data(as_text=True)
+
+
+def test_event_export_window_skips_recurrence_copies_outside_it(client, add, admin_id):
+    series = dict(title="Rosary", status="approved", user_id=admin_id, is_recurring=True,
+                  recurring_week="First", recurring_day="Friday", recurring_time="19:00")
+    add(Event, **series)
+    for month in (1, 10):
+        add(Event, source="recurrence", date_time=datetime(2026, month, 2, 19), **series)
+
+    rows = client.get("/export/events.csv?start=2026-10-01&end=2026-11-01").get_data(as_text=True).splitlines()
+    assert [row.split(",")[3] for row in rows[1:]] == ["", "2026-10-02T19:00:00"]
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+
+from main import Event
+
+
+@pytest.fixture
+def events(add, admin_id):
+    for title, status in [("Approved", "approved"), ("Pending", "pending"), ("Rejected", "rejected")]:
+        add(Event, title=title, status=status, user_id=admin_id, date_time=datetime(2026, 10, 1, 19))
+
+
+@pytest.mark.parametrize("status", ["pending", "rejected", "all"])
+def test_events_json_hides_unmoderated_from_anonymous(client, events, status):
+    assert client.get(f"/data/events.json?status={status}").status_code == 403
+
+
+def test_events_json_defaults_to_approved(client, events):
+    assert [e["title"] for e in client.get("/data/events.json").json] == ["Approved"]
+
+
+def test_events_json_unmoderated_for_admins(admin_client, events):
+    titles = {e["title"] for e in admin_client.get("/data/events.json?status=all").json}
+    assert titles == {"Approved", "Pending", "Rejected"}
+
+
+def test_events_json_window_skips_recurrence_copies_outside_it(client, add, admin_id):
+    series = dict(status="approved", user_id=admin_id, is_recurring=True,
+                  recurring_week="First", recurring_day="Friday", recurring_time="19:00")
+    add(Event, title="Rosary", **series)
+    for month in (1, 2, 10):
+        add(Event, title="Rosary", source="recurrence", date_time=datetime(2026, month, 2, 19), **series)
+    add(Event, title="Earlier", status="approved", user_id=admin_id, date_time=datetime(2026, 9, 1, 19))
+    add(Event, title="Inside", status="approved", user_id=admin_id, date_time=datetime(2026, 10, 9, 19))
+
+    events = client.get("/data/events.json?start=2026-10-01&end=2026-11-01").json
+    assert [(e["title"], e["date_time"]) for e in events] == [
+        ("Rosary", None),
+        ("Rosary", "2026-10-02T19:00:00"),
+        ("Inside", "2026-10-09T19:00:00"),
+    ]
+
+
+def test_admin_etag_does_not_revalidate_for_anonymous(app, admin_client, events):
+    admin_response = admin_client.get("/data/events.json?status=all")
+    etag = admin_response.headers["ETag"]
+    assert "Cookie" in admin_response.headers["Vary"]
+    assert admin_response.headers["Cache-Control"] == "private, no-cache"
+    assert admin_client.get("/data/events.json?status=all", headers={"If-None-Match": etag}).status_code == 304
+
+    anonymous = app.test_client()
+    assert anonymous.get("/data/events.json?status=all", headers={"If-None-Match": etag}).status_code == 403
+
+
+def test_public_feed_stays_shareable(client, events):
+    response = client.get("/data/events.json")
+    assert "Cookie" not in response.headers.get("Vary", "")
+    assert response.headers["Cache-Control"] == "no-cache"
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import ical
+from main import Event
+
+DTSTAMP = datetime(2026, 10, 18, tzinfo=timezone.utc)
+FIRST_FRIDAY = dict(id=1, title="Adoration", is_recurring=True,
+                    recurring_week="first", recurring_day="Friday", recurring_time="7:00 PM")
+
+
+def dtstart(event):
+    lines = ical.vevent(event, DTSTAMP).split("\r\n")
+    return next(line for line in lines if line.startswith("DTSTART:"))
+
+
+def test_dated_series_starts_on_its_rule():
+    # Thursday 1 October is not a first Friday: DTSTART moves to the 2nd
+    assert dtstart(Event(date_time=datetime(2026, 10, 1, 19), **FIRST_FRIDAY)) == "DTSTART:20261002T190000"
+
+
+def test_undated_series_is_anchored_on_created_at():
+    event = Event(created_at=datetime(2026, 3, 10, 12), **FIRST_FRIDAY)
+    assert dtstart(event) == "DTSTART:20260403T190000"
+
+
+def test_undated_series_without_created_at_uses_a_fixed_epoch():
+    assert dtstart(Event(**FIRST_FRIDAY)) == "DTSTART:20240105T190000"
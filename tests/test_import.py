@@ -0,0 +1,31 @@
+import os
+
+from conftest import ROOT
+from event_import import event_files
+from main import Event, db
+
+HEADER = "title,date,time,address,zip_code,description,group_id,user_id\n"
+
+
+def test_default_files_are_event_files_only():
+    names = [os.path.basename(path) for path in event_files(os.path.join(ROOT, "static", "data"))]
+    assert "ne_zip_centroids.csv" not in names
+    assert "st_leonards_events.csv" in names
+
+
+def test_reimport_is_idempotent(app, add_group, admin_id, tmp_path):
+    group_id = add_group()
+    path = tmp_path / "events.csv"
+    path.write_text(HEADER
+                    + f"Adoration,2026-10-02,19:00,,,,{group_id},{admin_id}\n"
+                    + f"Adoration,2026-10-02,19:00,,,,{group_id},{admin_id}\n"   # repeated in the file
+                    + f"Adoration,2026-11-06,19:00,,,,{group_id},{admin_id}\n")
+    runner = app.test_cli_runner()
+
+    first = runner.invoke(args=["import-events", str(path)])
+    assert "Imported 2 events, skipped 1 already imported" in first.output
+    second = runner.invoke(args=["import-events", str(path)])
+    assert "Imported 0 events, skipped 3 already imported" in second.output
+
+    with app.app_context():
+        assert db.session.query(Event).count() == 2
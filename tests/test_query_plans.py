@@ -0,0 +1,32 @@
+"""The hot queries must SEARCH an index on a schema built by the migrations, never SCAN a table."""
+import os
+
+import pytest
+from flask_migrate import downgrade, stamp, upgrade
+
+import main
+import query_plans
+from conftest import ROOT, reset_caches
+
+MIGRATIONS = os.path.join(ROOT, "migrations")
+BASELINE = "2cf2208f3076"   # the chain can't start from an empty database
+
+
+@pytest.fixture(scope="module")
+def plans():
+    """``{label: (plan, scans)}`` once every migration after the baseline has been applied."""
+    with main.app.app_context():
+        main.db.drop_all()
+        main.db.create_all()
+        stamp(MIGRATIONS, "head")
+        downgrade(MIGRATIONS, BASELINE)   # drops what the later migrations create...
+        upgrade(MIGRATIONS, "head")       # ...and lets them build it again
+        yield query_plans.check(main.db.session, main.hot_queries())
+        main.db.session.remove()
+    reset_caches()
+
+
+@pytest.mark.parametrize("label", list(main.hot_queries()))
+def test_hot_query_uses_an_index(plans, label):
+    plan, scans = plans[label]
+    assert not scans, f"{label} scans a table:\n" + "\n".join(plan)
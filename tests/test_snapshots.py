@@ -0,0 +1,16 @@
+import main
+from main import Catholic, db
+
+
+def test_catholic_commit_invalidates_every_watching_store(app, add_group):
+    group_id = add_group()
+    main.snapshots.put("all.json", 1, b"[]")
+    main.ical_feeds.put("all", 1, b"BEGIN:VCALENDAR")
+
+    with app.app_context():
+        db.session.get(Catholic, group_id).name = "Renamed"
+        db.session.commit()
+
+    assert main.snapshots.peek("all.json", 1) is None
+    assert main.ical_feeds.peek("all", 1) is None
+
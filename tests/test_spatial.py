@@ -0,0 +1,16 @@
+import spatial
+from main import Catholic, db
+
+
+def test_rtree_is_dropped_with_catholic(app, add_group):
+    add_group(name="Before reset")
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    # Same id as the row that was dropped: a stale R*Tree entry would collide
+    group_id = add_group(name="After reset")
+
+    with app.app_context():
+        hits = spatial.groups_near(db, Catholic, 42.35, -71.06, 5)
+        assert [(group.id, group.name) for group, _ in hits] == [(group_id, "After reset")]
@@ -0,0 +1,23 @@
+from geocode_queue import apply_geocode
+from main import Catholic, GeocodeJob, User, db, password_hasher
+
+
+def test_blank_zip_uncached_location_is_queued(app, client, add):
+    add(User, email="member@example.com", password=password_hasher.hash("pw"))
+    client.post("/login", data={"email": "member@example.com", "password": "pw"})
+
+    response = client.post("/start-group", data={
+        "name": "Newman Young Adults", "city": "Nowhereville", "state": "VT",
+        "zip_code": "", "approximate_age_range": "20s",
+    })
+    assert response.status_code == 302
+
+    with app.app_context():
+        group = db.session.execute(db.select(Catholic)).scalar_one()
+        assert group.zip_code == ""
+        assert [job.group_id for job in db.session.execute(db.select(GeocodeJob)).scalars()] == [group.id]
+
+        # the worker fills it in from the match
+        apply_geocode(group, [{"geometry": {"lat": 44.5, "lng": -73.2},
+                               "components": {"state_code": "VT", "postcode": "05401"}}])
+        assert group.zip_code == "05401"
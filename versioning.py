@@ -0,0 +1,152 @@
+"""Data-version counters and conditional GET for the public feeds.
+
+``data_version`` holds one row per scope (a table name).  SQLite triggers
+bump the row on every insert, update and delete, so the counter is right
+no matter who wrote the data: ORM, bulk Core statements, another worker
+process or the geocode worker.
+
+``conditional_feed`` turns the counters into a strong ETag and a
+Last-Modified date and answers revalidations with 304 before the view
+runs, i.e. before any ORM work.
+"""
+import hashlib
+import threading
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import g, request, make_response
+from sqlalchemy import DDL, bindparam, event, text
+
+
+VERSIONED_TABLES = ("catholic", "event")
+
+# A compressed body is a different representation, so it gets its own strong ETag
+ETAG_ENCODINGS = ("gzip", "br")
+
+
+def trigger_ddl(table):
+    bump = (
+        f"UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP"
+        f" WHERE scope = '{table}';"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_{op.lower()} AFTER {op} ON {table}"
+        f" BEGIN {bump} END"
+        for op in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+def seed_ddl():
+    values = ", ".join(f"('{table}', 0, CURRENT_TIMESTAMP)" for table in VERSIONED_TABLES)
+    return f"INSERT OR IGNORE INTO data_version (scope, version, updated_at) VALUES {values}"
+
+
+def install(version_table, tables):
+    """Seed the counters and create the bump triggers whenever the tables are created."""
+    event.listen(version_table, "after_create", DDL(seed_ddl()).execute_if(dialect="sqlite"))
+    for table in tables:
+        for statement in trigger_ddl(table.name):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def read_versions(session, scopes):
+    """``({scope: version}, last_modified)`` in one small query."""
+    rows = session.execute(
+        text("SELECT scope, version, updated_at FROM data_version WHERE scope IN :scopes")
+        .bindparams(bindparam("scopes", expanding=True)),
+        {"scopes": list(scopes)},
+    ).all()
+
+    versions = {scope: 0 for scope in scopes}
+    last_modified = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    for scope, version, updated_at in rows:
+        versions[scope] = version
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        if updated_at is not None:
+            last_modified = max(last_modified, updated_at.replace(tzinfo=timezone.utc))
+    return versions, last_modified
+
+
+def feed_etag(versions, *parts):
+    key = "|".join([request.endpoint or "", request.query_string.decode("latin-1"), *parts]
+                   + [f"{scope}={versions[scope]}" for scope in sorted(versions)])
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+def conditional_feed(db, *scopes, variant=None, access=None):
+    """Cache validators for a feed that depends only on the given tables.
+
+    ``variant()`` names the representation when one URL has several
+    (e.g. negotiated with ``Accept``), so each gets its own ETag.
+
+    ``access()`` runs before anything else, so a caller who may not see
+    the feed is refused even when holding a current ETag.  It returns
+    None for the public view, or a name for a restricted one (role and
+    filter); that goes into the ETag, and the response is marked private
+    and ``Vary: Cookie`` so shared caches never hand it to anyone else.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            restricted = access() if access else None
+            versions, last_modified = read_versions(db.session, scopes)
+            g.data_versions = versions   # lets the view key caches on the same versions
+            parts = [part for part in (variant() if variant else None, restricted) if part]
+            etag = feed_etag(versions, *parts)
+
+            if request.if_none_match:
+                matched = [tag for tag in (etag, *(f"{etag}-{enc}" for enc in ETAG_ENCODINGS))
+                           if request.if_none_match.contains(tag)]
+                not_modified = bool(matched)
+                if matched:
+                    etag = matched[0]
+            else:
+                since = request.if_modified_since
+                not_modified = since is not None and last_modified.replace(microsecond=0) <= since
+
+            if not_modified:
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                if response.content_encoding:
+                    etag = f"{etag}-{response.content_encoding}"
+
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers["Cache-Control"] = "no-cache"   # always revalidate, cheaply
+            if restricted:
+                response.headers["Cache-Control"] = "private, no-cache"
+                response.vary.add("Cookie")
+            return response
+        return wrapped
+    return decorator
+
+
+class VersionedCache:
+    """One value derived from a table, rebuilt only when its data version moves.
+
+    Each ``get`` costs a primary-key read of the counter instead of the
+    query behind the value, and sees writes from every process.
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+        self._version = None
+        self._value = None
+        self._lock = threading.Lock()
+
+    def get(self, session, build):
+        versions = getattr(g, "data_versions", None) or {}
+        version = versions.get(self.scope)
+        if version is None:
+            version = read_versions(session, [self.scope])[0][self.scope]
+
+        if self._version != version:
+            value = build()
+            with self._lock:
+                self._version, self._value = version, value
+            return value
+        return self._value
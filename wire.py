@@ -0,0 +1,88 @@
+"""Compact "columnar" representation for the group and event feeds.
+
+The default feeds are arrays of objects, which repeat every key on every
+row.  The columnar form names each field once and sends one array of
+values per field::
+
+    {"fields": ["id", "name", "lat", ...], "count": 2,
+     "scale": {"lat": 100000, "lon": 100000},
+     "columns": [[1, 2], ["St. Anne", "YCP Boston"], [4235812, 4236011], ...]}
+
+Coordinates are sent as integers in units of 1/``scale`` degree (about a
+metre), which is shorter than a float and compresses better; the client
+divides by ``scale``.  The same structure can be sent as MessagePack when
+the optional ``msgpack`` package is installed.
+
+Clients opt in with ``?format=columnar`` / ``?format=msgpack`` or an
+``Accept`` header naming one of the media types below; plain JSON stays
+the default.
+"""
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from flask import request
+from werkzeug.exceptions import NotAcceptable
+
+
+JSON = "application/json"
+COLUMNAR = "application/vnd.columnar+json"
+MSGPACK = "application/msgpack"
+MIMETYPES = {"json": JSON, "columnar": COLUMNAR, "msgpack": MSGPACK}
+
+COORD_SCALE = 100_000   # 1e-5 degree, about 1.1 m
+QUANTIZED = ("lat", "lon")
+
+# Fields each feed sends in columnar form: what the pages read, not all of to_dict()
+GROUP_FIELDS = ("id", "name", "city", "state", "group_details", "website_address",
+                "social_media", "lat", "lon", "img_url", "zip_code")          # /all
+MAP_FIELDS = ("name", "description", "lat", "lon", "city", "state", "website", "social")  # /data/groups.json
+EVENT_FIELDS = ("id", "title", "description", "date_time", "address", "zip_code", "lat", "lon",
+                "status", "city", "ics_url", "is_recurring", "recurring_day", "recurring_week",
+                "recurring_time", "link")                                     # /data/events.json
+
+
+def requested_format():
+    """ "json", "columnar" or "msgpack" for the current request; raises NotAcceptable."""
+    name = request.args.get("format")
+    if name:
+        if name not in MIMETYPES:
+            raise NotAcceptable(f"format must be one of: {', '.join(MIMETYPES)}")
+        if name == "msgpack" and msgpack is None:
+            raise NotAcceptable("MessagePack is not available on this server")
+        return name
+
+    offered = [JSON, COLUMNAR] + ([MSGPACK] if msgpack is not None else [])
+    best = request.accept_mimetypes.best_match(offered, default=JSON)
+    return next(name for name, mimetype in MIMETYPES.items() if mimetype == best)
+
+
+def quantize(value):
+    return None if value is None else round(value * COORD_SCALE)
+
+
+def columns(rows, fields):
+    """The columnar payload for ``rows`` (dicts), keeping only ``fields``."""
+    data = []
+    for field in fields:
+        column = [row.get(field) for row in rows]
+        if field in QUANTIZED:
+            column = [quantize(value) for value in column]
+        data.append(column)
+    return {
+        "fields": list(fields),
+        "count": len(rows),
+        "scale": {field: COORD_SCALE for field in fields if field in QUANTIZED},
+        "columns": data,
+    }
+
+
+def encode(rows, fields, fmt):
+    """``rows`` as columnar bytes in ``fmt`` ("columnar" or "msgpack")."""
+    payload = columns(rows, fields)
+    if fmt == "msgpack":
+        return msgpack.packb(payload, use_bin_type=True)
+    return json.dumps(payload, separators=(",", ":")).encode()